@@ -6,11 +6,20 @@ the reference lap.
 
 from __future__ import annotations
 
-from racing_coach.analysis.models import ApexSpeedResult, LapFrame
+from operator import attrgetter
+
+from racing_coach.analysis.models import (
+    ApexSpeedResult,
+    LapFrame,
+    frames_between,
+    is_pct_ordered,
+)
 from racing_coach.track.models import Corner
 
 _MPS_TO_KPH = 3.6
 
+_speed = attrgetter("speed")
+
 
 class ApexSpeedAnalyzer:
     """Analyse minimum speed in the apex zone for each corner."""
@@ -25,14 +34,20 @@ class ApexSpeedAnalyzer:
         """Return one :class:`ApexSpeedResult` per corner.
 
         Args:
-            user_lap: Ordered frames for the user lap.
-            ref_lap: Ordered frames for the reference lap.
+            user_lap: Frames for the user lap, in time order.  Laps whose
+                ``lap_dist_pct`` never decreases take the binary-search path;
+                others (a wrap past the line, a spin) are filtered linearly.
+            ref_lap: Frames for the reference lap, in time order.
             corners: List of corners (from Sprint 2).
             too_slow_threshold_kph: Speed deficit (km/h) above which the apex
                 is flagged as "too slow".  Default: 5 km/h.
         """
+        user_ordered = is_pct_ordered(user_lap)
+        ref_ordered = is_pct_ordered(ref_lap)
         return [
-            self._analyze_corner(user_lap, ref_lap, corner, too_slow_threshold_kph)
+            self._analyze_corner(
+                user_lap, ref_lap, corner, too_slow_threshold_kph, user_ordered, ref_ordered
+            )
             for corner in corners
         ]
 
@@ -40,14 +55,10 @@ class ApexSpeedAnalyzer:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _apex_min_speed(self, lap: list[LapFrame], corner: Corner) -> float:
+    def _apex_min_speed(self, lap: list[LapFrame], corner: Corner, ordered: bool) -> float:
         """Return the minimum speed in the apex zone, or 0 if no frames found."""
-        apex_speeds = [
-            f.speed
-            for f in lap
-            if corner.apex_start <= f.lap_dist_pct <= corner.apex_end
-        ]
-        return min(apex_speeds) if apex_speeds else 0.0
+        apex = frames_between(lap, corner.apex_start, corner.apex_end, ordered=ordered)
+        return min(map(_speed, apex), default=0.0)
 
     def _analyze_corner(
         self,
@@ -55,9 +66,11 @@ class ApexSpeedAnalyzer:
         ref_lap: list[LapFrame],
         corner: Corner,
         threshold_kph: float,
+        user_ordered: bool,
+        ref_ordered: bool,
     ) -> ApexSpeedResult:
-        user_min = self._apex_min_speed(user_lap, corner)
-        ref_min = self._apex_min_speed(ref_lap, corner)
+        user_min = self._apex_min_speed(user_lap, corner, user_ordered)
+        ref_min = self._apex_min_speed(ref_lap, corner, ref_ordered)
         delta_kph = (user_min - ref_min) * _MPS_TO_KPH
         too_slow = delta_kph < -threshold_kph
 
@@ -9,7 +9,14 @@ Analyses the braking event for each corner:
 
 from __future__ import annotations
 
-from racing_coach.analysis.models import BrakingEvent, LapFrame
+from operator import mul
+
+from racing_coach.analysis.models import (
+    BrakingEvent,
+    LapFrame,
+    frames_between,
+    is_pct_ordered,
+)
 from racing_coach.track.models import Corner
 
 # ---------------------------------------------------------------------------
@@ -20,23 +27,21 @@ def _linear_r_squared(values: list[float]) -> float:
     """Return R² of a linear least-squares fit to *values* (x = 0, 1, ..., n-1).
 
     Returns 1.0 when n < 3 (trivially linear) or when all values are constant.
+
+    Uses the closed form R² = Sxy² / (Sxx · Syy) of a simple regression, with
+    Sxx = n(n² - 1) / 12 for evenly spaced x, so only three C-level sums over
+    *values* are needed instead of separate fit and residual passes.
     """
     n = len(values)
     if n < 3:
         return 1.0
-    x_mean = (n - 1) / 2.0
-    y_mean = sum(values) / n
-    sxy = sum((i - x_mean) * (v - y_mean) for i, v in enumerate(values))
-    sxx = sum((i - x_mean) ** 2 for i in range(n))
-    if sxx < 1e-12:
-        return 1.0
-    slope = sxy / sxx
-    intercept = y_mean - slope * x_mean
-    ss_res = sum((v - (slope * i + intercept)) ** 2 for i, v in enumerate(values))
-    ss_tot = sum((v - y_mean) ** 2 for v in values)
-    if ss_tot < 1e-12:
+    sy = sum(values)
+    sxy = sum(map(mul, range(n), values)) - (n - 1) / 2.0 * sy
+    syy = sum(map(mul, values, values)) - sy * sy / n
+    if syy < 1e-12:
         return 1.0
-    return max(0.0, 1.0 - ss_res / ss_tot)
+    sxx = n * (n * n - 1) / 12.0
+    return min(1.0, max(0.0, sxy * sxy / (sxx * syy)))
 
 
 # ---------------------------------------------------------------------------
@@ -81,13 +86,19 @@ class BrakingAnalyzer:
         """Return one :class:`BrakingEvent` per corner.
 
         Args:
-            user_lap: Ordered frames for the user's lap.
-            ref_lap: Ordered frames for the reference lap.
+            user_lap: Frames for the user's lap, in time order.  Laps whose
+                ``lap_dist_pct`` never decreases take the binary-search path;
+                others (a wrap past the line, a spin) are filtered linearly.
+            ref_lap: Frames for the reference lap, in time order.
             corners: Corners to analyse (from :class:`~racing_coach.track.models.Corner`).
             track_length_m: Track length used to convert pct differences to metres.
         """
+        user_ordered = is_pct_ordered(user_lap)
+        ref_ordered = is_pct_ordered(ref_lap)
         return [
-            self._analyze_corner(user_lap, ref_lap, corner, track_length_m)
+            self._analyze_corner(
+                user_lap, ref_lap, corner, track_length_m, user_ordered, ref_ordered
+            )
             for corner in corners
         ]
 
@@ -95,35 +106,40 @@ class BrakingAnalyzer:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _brake_zone(self, lap: list[LapFrame], corner: Corner) -> list[LapFrame]:
+    def _brake_zone(
+        self, lap: list[LapFrame], corner: Corner, ordered: bool
+    ) -> list[LapFrame]:
         """Extract frames in the braking window: [entry - lookback, apex_start]."""
         lo = max(0.0, corner.entry_pct - self.lookback_fraction)
-        hi = corner.apex_start
-        return [f for f in lap if lo <= f.lap_dist_pct <= hi]
+        return frames_between(lap, lo, corner.apex_start, ordered=ordered)
+
+    def _braking_frames(self, frames: list[LapFrame]) -> list[LapFrame]:
+        """Return the frames where brake > threshold.
+
+        Filtered once per zone; the start / peak / linearity / lock helpers all
+        work on this list instead of each re-filtering the zone.
+        """
+        threshold = self.brake_threshold
+        return [f for f in frames if f.brake > threshold]
 
-    def _find_brake_start(self, frames: list[LapFrame], default_pct: float) -> float:
-        """Return the pct of the first frame where brake > threshold."""
-        for f in frames:
-            if f.brake > self.brake_threshold:
-                return f.lap_dist_pct
-        return default_pct
+    def _find_brake_start(self, braking: list[LapFrame], default_pct: float) -> float:
+        """Return the pct of the first braking frame, or *default_pct* if none."""
+        return braking[0].lap_dist_pct if braking else default_pct
 
-    def _find_peak(self, frames: list[LapFrame]) -> tuple[float, float]:
+    def _find_peak(self, braking: list[LapFrame]) -> tuple[float, float]:
         """Return (peak_pressure, seconds_from_brake_start_to_peak)."""
-        braking = [f for f in frames if f.brake > self.brake_threshold]
         if not braking:
             return 0.0, 0.0
         peak_frame = max(braking, key=lambda f: f.brake)
         time_to_peak = peak_frame.lap_time - braking[0].lap_time
         return peak_frame.brake, max(0.0, time_to_peak)
 
-    def _trail_brake_linearity(self, frames: list[LapFrame]) -> float:
+    def _trail_brake_linearity(self, braking: list[LapFrame]) -> float:
         """R² of the brake release phase (from peak to zero).
 
         Returns 0.0 if the brake stays constant after the peak (step release —
         no trail braking at all), and 1.0 if the release is perfectly linear.
         """
-        braking = [f for f in frames if f.brake > self.brake_threshold]
         if len(braking) < 3:
             return 1.0
         peak_idx = max(range(len(braking)), key=lambda i: braking[i].brake)
@@ -137,13 +153,12 @@ class BrakingAnalyzer:
             return 0.0
         return _linear_r_squared(release)
 
-    def _detect_lock(self, frames: list[LapFrame]) -> bool:
+    def _detect_lock(self, braking: list[LapFrame]) -> bool:
         """True if excessive deceleration is detected during any braking frame.
 
         Checks all frames where brake > threshold (not only peak braking), so
         a lock event during the release phase is also caught.
         """
-        braking = [f for f in frames if f.brake > self.brake_threshold]
         for i in range(1, len(braking)):
             dt = braking[i].lap_time - braking[i - 1].lap_time
             if dt <= 0:
@@ -159,17 +174,19 @@ class BrakingAnalyzer:
         ref_lap: list[LapFrame],
         corner: Corner,
         track_length_m: float,
+        user_ordered: bool,
+        ref_ordered: bool,
     ) -> BrakingEvent:
-        user_zone = self._brake_zone(user_lap, corner)
-        ref_zone = self._brake_zone(ref_lap, corner)
+        user_braking = self._braking_frames(self._brake_zone(user_lap, corner, user_ordered))
+        ref_braking = self._braking_frames(self._brake_zone(ref_lap, corner, ref_ordered))
 
-        user_bp = self._find_brake_start(user_zone, corner.entry_pct)
-        ref_bp = self._find_brake_start(ref_zone, corner.entry_pct)
+        user_bp = self._find_brake_start(user_braking, corner.entry_pct)
+        ref_bp = self._find_brake_start(ref_braking, corner.entry_pct)
         delta_m = (user_bp - ref_bp) * track_length_m
 
-        peak_pressure, time_to_peak = self._find_peak(user_zone)
-        linearity = self._trail_brake_linearity(user_zone)
-        lock = self._detect_lock(user_zone)
+        peak_pressure, time_to_peak = self._find_peak(user_braking)
+        linearity = self._trail_brake_linearity(user_braking)
+        lock = self._detect_lock(user_braking)
 
         return BrakingEvent(
             corner_id=corner.id,
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import bisect
+import operator
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class LapFrame:
     """A single telemetry frame used as input for all analysis modules.
 
     Can be constructed directly in tests or converted from storage dicts via
-    :meth:`from_storage_dict`.
+    :meth:`from_storage_dict` (one row) or :meth:`from_storage_columns` (a
+    whole lap); :meth:`from_arrays` builds a lap from parallel field sequences.
     """
 
     lap_dist_pct: float
@@ -43,8 +47,78 @@ class LapFrame:
             steering_angle=float(d["steering_angle"]),
         )
 
+    @classmethod
+    def from_arrays(
+        cls,
+        lap_dist_pct: Iterable[float],
+        lap_time: Iterable[float],
+        speed: Iterable[float],
+        throttle: Iterable[float],
+        brake: Iterable[float],
+        steering_angle: Iterable[float],
+    ) -> list[LapFrame]:
+        """Create one :class:`LapFrame` per index of parallel per-field sequences.
+
+        The constructor is mapped positionally over the columns, which skips
+        per-frame keyword binding and any intermediate row object.
+        """
+        return list(map(cls, lap_dist_pct, lap_time, speed, throttle, brake, steering_angle))
+
+    @classmethod
+    def from_storage_columns(cls, columns: dict[str, list]) -> list[LapFrame]:
+        """Create one :class:`LapFrame` per row of a column-oriented lap.
+
+        *columns* is the mapping returned by
+        :meth:`TelemetryStorage.get_lap_columns`; see :meth:`from_arrays`.
+        """
+        return cls.from_arrays(*(columns[name] for name in _LAP_FRAME_FIELDS))
+
+
+# LapFrame constructor argument order, as storage column names.
+_LAP_FRAME_FIELDS: tuple[str, ...] = (
+    "lap_dist_pct", "lap_time", "speed", "throttle", "brake", "steering_angle",
+)
+
+_by_pct = operator.attrgetter("lap_dist_pct")
+
+
+def is_pct_ordered(frames: list[LapFrame]) -> bool:
+    """True if ``lap_dist_pct`` never decreases along *frames*.
+
+    A lap that wraps past the start/finish line (0.99 → 0.0), or a spin or
+    reset that moves the car backwards, is not ordered.
+    """
+    pcts = list(map(_by_pct, frames))
+    return not any(map(operator.gt, pcts, pcts[1:]))
+
+
+def frames_between(
+    frames: list[LapFrame], lo: float, hi: float, *, ordered: bool | None = None
+) -> list[LapFrame]:
+    """Return the frames with ``lo <= lap_dist_pct <= hi``, in lap order.
+
+    When *frames* is ordered by ``lap_dist_pct`` both bounds are located by
+    binary search, so the cost is O(log n) plus the size of the returned
+    window; otherwise this falls back to a linear filter.
+
+    Args:
+        frames: Frames of one lap.
+        lo: Lower ``lap_dist_pct`` bound (inclusive).
+        hi: Upper ``lap_dist_pct`` bound (inclusive).
+        ordered: Result of :func:`is_pct_ordered` for *frames*, for callers
+            that take several windows from the same lap.  ``None`` checks it
+            here, which costs a full pass over *frames*.
+    """
+    if ordered is None:
+        ordered = is_pct_ordered(frames)
+    if not ordered:
+        return [f for f in frames if lo <= f.lap_dist_pct <= hi]
+    start = bisect.bisect_left(frames, lo, key=_by_pct)
+    stop = bisect.bisect_right(frames, hi, lo=start, key=_by_pct)
+    return frames[start:stop]
+
 
-@dataclass
+@dataclass(slots=True)
 class CornerDelta:
     """Time delta summary for a single corner.
 
@@ -69,7 +143,7 @@ class CornerDelta:
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class BrakingEvent:
     """Braking analysis result for a single corner approach."""
 
@@ -99,7 +173,7 @@ class BrakingEvent:
     """True if wheel-lock symptoms (high brake + excessive deceleration) were detected."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ThrottleEvent:
     """Throttle analysis result for a single corner exit."""
 
@@ -115,7 +189,7 @@ class ThrottleEvent:
     """Number of frames where both brake > 0.05 and throttle > 0.05 simultaneously."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ApexSpeedResult:
     """Apex minimum-speed analysis for a single corner."""
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import contextlib
 import sqlite3
+from collections.abc import Iterable
 
 _DDL = """
 PRAGMA journal_mode = WAL;
@@ -24,7 +25,10 @@ CREATE TABLE IF NOT EXISTS laps (
     UNIQUE (session_id, lap_number)
 );
 
-CREATE INDEX IF NOT EXISTS idx_laps_track_car ON laps (track, car);
+-- (track, car, lap_time_s) serves both the filter and the ORDER BY lap_time_s
+-- of the listing / fastest-lap queries, so SQLite never sorts in a temp B-tree.
+DROP INDEX IF EXISTS idx_laps_track_car;
+CREATE INDEX IF NOT EXISTS idx_laps_track_car_time ON laps (track, car, lap_time_s);
 """
 
 _INSERT_LAP = """
@@ -57,6 +61,11 @@ WHERE  track = ? AND car = ?
 ORDER  BY lap_time_s
 """
 
+# Result keys of _SELECT_ALL, in column order.
+_ALL_COLUMNS: tuple[str, ...] = (
+    "session_id", "lap_number", "track", "car", "lap_time_s", "is_reference",
+)
+
 _SELECT_FASTEST = """
 SELECT session_id, lap_number
 FROM   laps
@@ -68,6 +77,12 @@ LIMIT  1
 _EXISTS = "SELECT 1 FROM laps WHERE session_id = ? AND lap_number = ?"
 
 
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
 class ReferenceLapManager:
     """Manage reference lap selection for track + car combinations.
 
@@ -76,13 +91,19 @@ class ReferenceLapManager:
     """
 
     def __init__(self, db_path: str = "reference.db") -> None:
-        self._conn = sqlite3.connect(db_path)
-        self._conn.row_factory = sqlite3.Row
-        for stmt in _DDL.strip().split(";"):
-            stmt = stmt.strip()
-            if stmt:
-                self._conn.execute(stmt)
-        self._conn.commit()
+        self._conn = _connect(db_path)
+        self._conn.executescript(_DDL)
+
+    def copy_to_memory(self) -> ReferenceLapManager:
+        """Return an independent manager on an in-memory copy of this database.
+
+        The copy is taken with SQLite's online backup API, so the schema is
+        not re-created; changes to either manager are not seen by the other.
+        """
+        clone = object.__new__(type(self))
+        clone._conn = _connect(":memory:")
+        self._conn.backup(clone._conn)
+        return clone
 
     # ------------------------------------------------------------------
     # Public API
@@ -103,6 +124,16 @@ class ReferenceLapManager:
         self._conn.execute(_INSERT_LAP, (session_id, lap_number, track, car, lap_time_s))
         self._conn.commit()
 
+    def record_laps(self, laps: Iterable[tuple[str, int, str, str, float]]) -> None:
+        """Register many completed laps in a single transaction.
+
+        Each item is ``(session_id, lap_number, track, car, lap_time_s)``, as
+        for :meth:`record_lap`.  One commit covers the whole batch instead of
+        one per lap.  Existing (session_id, lap_number) pairs are ignored.
+        """
+        self._conn.executemany(_INSERT_LAP, laps)
+        self._conn.commit()
+
     def set_reference(self, session_id: str, lap_number: int) -> None:
         """Mark *session_id / lap_number* as the reference lap for its track+car.
 
@@ -135,8 +166,10 @@ class ReferenceLapManager:
 
     def get_all_laps(self, track: str, car: str) -> list[dict]:
         """Return all recorded laps for *track* / *car* ordered by lap time."""
-        rows = self._conn.execute(_SELECT_ALL, (track, car)).fetchall()
-        return [dict(r) for r in rows]
+        cur = self._conn.cursor()
+        cur.row_factory = None  # plain tuples; keys come from _ALL_COLUMNS
+        rows = cur.execute(_SELECT_ALL, (track, car)).fetchall()
+        return [dict(zip(_ALL_COLUMNS, row, strict=True)) for row in rows]
 
     def close(self) -> None:
         """Close the database connection."""
@@ -8,7 +8,12 @@ Analyses throttle behaviour in each corner's exit phase:
 
 from __future__ import annotations
 
-from racing_coach.analysis.models import LapFrame, ThrottleEvent
+from racing_coach.analysis.models import (
+    LapFrame,
+    ThrottleEvent,
+    frames_between,
+    is_pct_ordered,
+)
 from racing_coach.track.models import Corner
 
 
@@ -48,16 +53,30 @@ class ThrottleAnalyzer:
         ref_lap: list[LapFrame],
         corners: list[Corner],
     ) -> list[ThrottleEvent]:
-        """Return one :class:`ThrottleEvent` per corner."""
-        return [self._analyze_corner(user_lap, ref_lap, corner) for corner in corners]
+        """Return one :class:`ThrottleEvent` per corner.
+
+        Args:
+            user_lap: Frames for the user's lap, in time order.  Laps whose
+                ``lap_dist_pct`` never decreases take the binary-search path;
+                others (a wrap past the line, a spin) are filtered linearly.
+            ref_lap: Frames for the reference lap (currently unused).
+            corners: Corners to analyse.
+        """
+        user_ordered = is_pct_ordered(user_lap)
+        return [
+            self._analyze_corner(user_lap, ref_lap, corner, user_ordered)
+            for corner in corners
+        ]
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _exit_frames(self, lap: list[LapFrame], corner: Corner) -> list[LapFrame]:
+    def _exit_frames(
+        self, lap: list[LapFrame], corner: Corner, ordered: bool
+    ) -> list[LapFrame]:
         """Extract frames in the exit zone: [apex_end, exit_pct]."""
-        return [f for f in lap if corner.apex_end <= f.lap_dist_pct <= corner.exit_pct]
+        return frames_between(lap, corner.apex_end, corner.exit_pct, ordered=ordered)
 
     def _find_throttle_point(self, frames: list[LapFrame], default_pct: float) -> float:
         """Return the pct of the first frame where throttle > threshold."""
@@ -74,14 +93,12 @@ class ThrottleAnalyzer:
                 return True
         return False
 
-    def _count_overlap(self, lap: list[LapFrame], corner: Corner) -> int:
+    def _count_overlap(self, lap: list[LapFrame], corner: Corner, ordered: bool) -> int:
         """Count frames in the full corner range where both brake and throttle are active."""
         return sum(
             1
-            for f in lap
-            if corner.entry_pct <= f.lap_dist_pct <= corner.exit_pct
-            and f.brake > self.brake_overlap_min
-            and f.throttle > self.throttle_overlap_min
+            for f in frames_between(lap, corner.entry_pct, corner.exit_pct, ordered=ordered)
+            if f.brake > self.brake_overlap_min and f.throttle > self.throttle_overlap_min
         )
 
     def _analyze_corner(
@@ -89,12 +106,13 @@ class ThrottleAnalyzer:
         user_lap: list[LapFrame],
         ref_lap: list[LapFrame],
         corner: Corner,
+        user_ordered: bool,
     ) -> ThrottleEvent:
-        user_exit = self._exit_frames(user_lap, corner)
+        user_exit = self._exit_frames(user_lap, corner, user_ordered)
 
         throttle_pct = self._find_throttle_point(user_exit, corner.exit_pct)
         early_full = self._detect_early_full_throttle(user_exit)
-        overlap = self._count_overlap(user_lap, corner)
+        overlap = self._count_overlap(user_lap, corner, user_ordered)
 
         return ThrottleEvent(
             corner_id=corner.id,
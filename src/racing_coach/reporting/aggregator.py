@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from operator import attrgetter
+from typing import TypeVar
+
 from racing_coach.analysis.models import (
     ApexSpeedResult,
     BrakingEvent,
@@ -10,6 +14,15 @@ from racing_coach.analysis.models import (
 )
 from racing_coach.reporting.models import CornerReport, LapReport
 
+_by_delta_total = attrgetter("delta_total")
+
+_R = TypeVar("_R", BrakingEvent, ThrottleEvent, ApexSpeedResult)
+
+
+def _index_by_corner(results: Iterable[_R] | None) -> dict[int, _R]:
+    """Map ``corner_id`` → result; later entries win."""
+    return {r.corner_id: r for r in results or ()}
+
 
 class LapReportAggregator:
     """Combine Sprint 3 analysis results into a single :class:`LapReport`.
@@ -35,9 +48,9 @@ class LapReportAggregator:
         ``corners`` in the returned report are sorted by ``delta_total``
         descending so the biggest time losses appear first.
         """
-        braking_map = {b.corner_id: b for b in (braking_events or [])}
-        throttle_map = {t.corner_id: t for t in (throttle_events or [])}
-        apex_map = {a.corner_id: a for a in (apex_results or [])}
+        braking_map = _index_by_corner(braking_events)
+        throttle_map = _index_by_corner(throttle_events)
+        apex_map = _index_by_corner(apex_results)
 
         corners = [
             CornerReport(
@@ -53,7 +66,7 @@ class LapReportAggregator:
             for cd in corner_deltas
         ]
 
-        corners.sort(key=lambda c: c.delta_total, reverse=True)
+        corners.sort(key=_by_delta_total, reverse=True)
 
         return LapReport(
             session_id=session_id,
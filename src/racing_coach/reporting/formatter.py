@@ -12,25 +12,31 @@ _SEVERITY_LABEL: dict[str, str] = {
     "low": "低优先级",
 }
 
-
-def _format_corner(cr: CornerReport) -> list[str]:
-    lines: list[str] = []
-
-    lines.append(f"### 弯道 {cr.corner_id}  (时间损失: {cr.delta_total:+.3f}s)")
-    lines.append("")
-    lines.append(
-        "| 阶段 | 时间差 |\n"
-        "|------|--------|\n"
-        f"| 入弯 | {cr.delta_entry:+.3f}s |\n"
-        f"| 弯心 | {cr.delta_apex:+.3f}s |\n"
-        f"| 出弯 | {cr.delta_exit:+.3f}s |"
-    )
-    lines.append("")
+# Fixed per-corner template: the heading, phase table and their blank
+# separator lines are one chunk.
+_CORNER_HEAD = (
+    "### 弯道 {0}  (时间损失: {1:+.3f}s)\n"
+    "\n"
+    "| 阶段 | 时间差 |\n"
+    "|------|--------|\n"
+    "| 入弯 | {2:+.3f}s |\n"
+    "| 弯心 | {3:+.3f}s |\n"
+    "| 出弯 | {4:+.3f}s |\n"
+)
+
+
+def _format_corner(cr: CornerReport, lines: list[str]) -> None:
+    """Append the Markdown lines for *cr* to *lines*."""
+    append = lines.append
+
+    append(_CORNER_HEAD.format(
+        cr.corner_id, cr.delta_total, cr.delta_entry, cr.delta_apex, cr.delta_exit,
+    ))
 
     if cr.braking:
         b = cr.braking
         lock_str = " **⚠ 轮胎抱死**" if b.lock_detected else ""
-        lines.append(
+        append(
             f"- **刹车**: 刹车点偏差 {b.brake_point_delta_m:+.1f}m，"
             f"峰值压力 {b.peak_pressure:.2f}，"
             f"Trail brake 质量 {b.trail_brake_linearity:.2f}{lock_str}"
@@ -39,22 +45,21 @@ def _format_corner(cr: CornerReport) -> list[str]:
     if cr.throttle:
         t = cr.throttle
         early_str = " **⚠ 过早全油门**" if t.too_early_full_throttle else ""
-        lines.append(f"- **油门**: 重叠帧 {t.overlap_count} 个{early_str}")
+        append(f"- **油门**: 重叠帧 {t.overlap_count} 个{early_str}")
 
     if cr.apex_speed:
         a = cr.apex_speed
         slow_str = " **⚠ 偏慢**" if a.too_slow else ""
-        lines.append(f"- **弯心速度**: {a.delta_kph:+.1f} km/h vs 参考圈{slow_str}")
+        append(f"- **弯心速度**: {a.delta_kph:+.1f} km/h vs 参考圈{slow_str}")
 
     if cr.suggestions:
-        lines.append("")
-        lines.append("**建议**:")
+        append("")
+        append("**建议**:")
         for s in cr.suggestions:
             label = _SEVERITY_LABEL.get(s.severity, s.severity)
-            lines.append(f"  - [{label}] {s.suggestion}")
+            append(f"  - [{label}] {s.suggestion}")
 
-    lines.append("")
-    return lines
+    append("")
 
 
 class MarkdownFormatter:
@@ -82,7 +87,7 @@ class MarkdownFormatter:
         # Per-corner analysis
         lines += ["## 逐弯分析", ""]
         for corner in report.corners:
-            lines.extend(_format_corner(corner))
+            _format_corner(corner, lines)
 
         # Top improvements
         if report.top_improvements:
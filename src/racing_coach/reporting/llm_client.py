@@ -7,6 +7,7 @@ secret managers.
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import os
@@ -30,6 +31,12 @@ def parse_llm_response(raw: str) -> tuple[str, list[Suggestion]]:
 
     Returns ``("", [])`` on any parse or structure error.
     """
+    # Only a JSON object can carry the expected fields; a reply that does not
+    # open with "{" (typically plain prose) is rejected without invoking the
+    # decoder and its exception path.
+    raw = raw.lstrip()
+    if not raw.startswith("{"):
+        return "", []
     try:
         data = json.loads(raw)
         summary = str(data.get("summary", ""))
@@ -168,31 +175,35 @@ class MoonshotClient:
 
         system_prompt, user_prompt = builder.build_messages(report)
         raw_text, _ = self.generate(system_prompt, user_prompt)
+        corner_map = report.corners_by_id()
 
         if raw_text:
             summary, suggestions = parse_llm_response(raw_text)
             if suggestions or summary:
-                corner_map = {c.corner_id: c for c in report.corners}
                 for s in suggestions:
-                    if s.corner_id in corner_map:
-                        corner_map[s.corner_id].suggestions.append(s)
+                    corner = corner_map.get(s.corner_id)
+                    if corner is not None:
+                        corner.suggestions.append(s)
                 report.summary = summary
-                report.top_improvements = sorted(
+                # Top 3 by corner time loss; nlargest keeps ties in input order,
+                # exactly like a stable sort + slice, without sorting everything.
+                report.top_improvements = heapq.nlargest(
+                    3,
                     suggestions,
-                    key=lambda s: -(
+                    key=lambda s: (
                         corner_map[s.corner_id].delta_total
                         if s.corner_id in corner_map
                         else 0.0
                     ),
-                )[:3]
+                )
                 return report
 
         # Fallback: rule-based suggestions
         suggestions = fallback_suggestions(report)
-        corner_map = {c.corner_id: c for c in report.corners}
         for s in suggestions:
-            if s.corner_id in corner_map:
-                corner_map[s.corner_id].suggestions.append(s)
+            corner = corner_map.get(s.corner_id)
+            if corner is not None:
+                corner.suggestions.append(s)
         report.top_improvements = suggestions[:3]
         report.summary = "基于规则引擎生成的分析（LLM服务不可用）。"
         return report
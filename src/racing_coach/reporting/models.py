@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from racing_coach.analysis.models import ApexSpeedResult, BrakingEvent, ThrottleEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class Suggestion:
     """A single improvement suggestion for one corner.
 
@@ -23,7 +23,7 @@ class Suggestion:
     suggestion: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CornerReport:
     """Aggregated analysis for a single corner.
 
@@ -42,7 +42,7 @@ class CornerReport:
     suggestions: list[Suggestion] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class LapReport:
     """Full analysis report for a single lap.
 
@@ -59,6 +59,14 @@ class LapReport:
     top_improvements: list[Suggestion] = field(default_factory=list)
     summary: str = ""
 
+    def corners_by_id(self) -> dict[int, CornerReport]:
+        """Return ``corner_id`` → :class:`CornerReport` for O(1) lookups.
+
+        Built on each call rather than cached: ``corners`` is a plain mutable
+        list, and the class is slotted (no ``cached_property`` storage).
+        """
+        return {c.corner_id: c for c in self.corners}
+
     def to_dict(self) -> dict:
         """Return a JSON-serializable dict (recursive via :func:`dataclasses.asdict`)."""
         return dataclasses.asdict(self)
@@ -16,22 +16,27 @@ _SYSTEM_PROMPT = """你是一位专业的赛车教练AI助手，专注于为赛
 3. 每条建议必须直接对应数据中的具体观测值，并给出可操作的改进方向。
 4. severity字段只能使用 'high'、'medium'、'low' 三个值。"""
 
-_USER_TEMPLATE = """以下是一圈的遥测分析结果：
+# The user prompt is the only per-call text: a small header formatted with the
+# lap metadata, the corner details, then a fixed footer joined on verbatim
+# (the JSON example needs no brace escaping and is never re-parsed).
+_USER_HEADER = """以下是一圈的遥测分析结果：
 
 赛道：{track}
 车辆：{car}
 总时间差：{total_delta:+.3f}s（正值=比参考圈慢）
 
 逐弯详情：
-{corners_text}
+"""
+
+_USER_FOOTER = """
 
 请严格按照以下JSON格式输出（不要输出任何JSON之外的内容）：
-{{
+{
   "summary": "1-2句对整圈表现的总体评价",
   "suggestions": [
-    {{"corner_id": <整数>, "severity": "high|medium|low", "suggestion": "<具体可操作的改进建议>"}}
+    {"corner_id": <整数>, "severity": "high|medium|low", "suggestion": "<具体可操作的改进建议>"}
   ]
-}}"""
+}"""
 
 
 # ---------------------------------------------------------------------------
@@ -88,13 +93,13 @@ class PromptBuilder:
 
     def build(self, report: LapReport) -> str:
         """Build the user-turn prompt from *report*."""
-        corners_text = "\n\n".join(_format_corner(c) for c in report.corners)
-        return _USER_TEMPLATE.format(
+        header = _USER_HEADER.format(
             track=report.track,
             car=report.car,
             total_delta=report.total_delta_s,
-            corners_text=corners_text,
         )
+        corners_text = "\n\n".join(map(_format_corner, report.corners))
+        return "".join((header, corners_text, _USER_FOOTER))
 
     def build_messages(self, report: LapReport) -> tuple[str, str]:
         """Return ``(system_prompt, user_prompt)`` ready for the chat API."""
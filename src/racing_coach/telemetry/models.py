@@ -6,7 +6,7 @@ import math
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryFrame:
     """A single sampled frame of iRacing telemetry data.
 
@@ -59,4 +59,4 @@ class TelemetryFrame:
             self.lap_dist_pct,
             self.lap_time,
         )
-        return all(math.isfinite(f) for f in floats)
+        return all(map(math.isfinite, floats))
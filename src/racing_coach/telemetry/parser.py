@@ -3,47 +3,38 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
 
 from racing_coach.telemetry.models import TelemetryFrame
 
 _G = 9.80665  # m/s² per standard gravity
 
-# iRacing SDK field name → (TelemetryFrame field, conversion fn, clamp_min, clamp_max)
-# clamp_min/max of None means no bound on that side.
-_FIELD_MAP: tuple[tuple[str, str, float | None, float | None], ...] = (
-    # raw_key           frame_field        min    max
-    ("Speed",               "speed",           0.0,  None),
-    ("Throttle",            "throttle",        0.0,  1.0),
-    ("Brake",               "brake",           0.0,  1.0),
-    ("SteeringWheelAngle",  "steering_angle",  None, None),
-    ("RPM",                 "rpm",             0.0,  None),
-    ("LapDistPct",          "lap_dist_pct",    0.0,  1.0),
-    ("LapCurrentLapTime",   "lap_time",        0.0,  None),
-)
-
-_INT_FIELD_MAP: tuple[tuple[str, str, int | None, int | None], ...] = (
-    ("Gear",  "gear",       -1, 8),
-    ("Lap",   "lap_number",  0, None),
-)
-
-
-def _sanitize(value: float, lo: float | None, hi: float | None) -> float:
-    """Return value clamped to [lo, hi], with NaN/Inf replaced by lo (or 0)."""
-    if not math.isfinite(value):
-        value = lo if lo is not None else 0.0
-    if lo is not None and value < lo:
-        value = lo
-    if hi is not None and value > hi:
-        value = hi
-    return value
-
-
-def _sanitize_int(value: int, lo: int | None, hi: int | None) -> int:
-    if lo is not None and value < lo:
-        value = lo
-    if hi is not None and value > hi:
-        value = hi
-    return value
+_INF = math.inf
+
+# Integer field bounds (TelemetryFrame.gear: -1=reverse, 0=neutral, 1-8=forward)
+_GEAR_MIN = -1
+_GEAR_MAX = 8
+
+
+# Clamps, one per bound shape, so the hot path carries no optional-bound tests
+# and no ``math.isfinite`` call.  The chained comparisons are False for NaN and
+# for ±Inf, so non-finite input falls through to the lower bound (0.0).
+
+def _clamp_unit(value: float) -> float:
+    """Clamp to [0, 1]; NaN/Inf become 0."""
+    if 0.0 <= value <= 1.0:
+        return value
+    return 1.0 if 1.0 < value < _INF else 0.0
+
+
+def _clamp_non_negative(value: float) -> float:
+    """Clamp to [0, ∞); NaN/Inf become 0."""
+    return value if 0.0 <= value < _INF else 0.0
+
+
+def _clamp_finite(value: float) -> float:
+    """Replace NaN/Inf by 0; finite values pass through."""
+    return value if -_INF < value < _INF else 0.0
 
 
 class TelemetryParser:
@@ -55,20 +46,31 @@ class TelemetryParser:
 
     def parse(self, raw: dict) -> TelemetryFrame:
         """Convert *raw* iRacing data snapshot to a validated :class:`TelemetryFrame`."""
-        kwargs: dict = {}
-
-        for raw_key, frame_field, lo, hi in _FIELD_MAP:
-            val = float(raw.get(raw_key) or 0.0)
-            kwargs[frame_field] = _sanitize(val, lo, hi)
-
-        for raw_key, frame_field, lo, hi in _INT_FIELD_MAP:
-            val = int(raw.get(raw_key) or 0)
-            kwargs[frame_field] = _sanitize_int(val, lo, hi)
-
-        # G-force: iRacing gives m/s², convert to g
-        lon_raw = float(raw.get("LongAccel") or 0.0)
-        lat_raw = float(raw.get("LatAccel") or 0.0)
-        kwargs["g_force_lon"] = _sanitize(lon_raw / _G, None, None)
-        kwargs["g_force_lat"] = _sanitize(lat_raw / _G, None, None)
-
-        return TelemetryFrame(**kwargs)
+        # One straight-line expression per field, passed positionally in
+        # TelemetryFrame order: no per-field loop, no kwargs dict.  Each key is
+        # hashed once, through a pre-bound ``raw.get``.
+        get = raw.get
+        gear = int(get("Gear") or 0)
+        lap_number = int(get("Lap") or 0)
+        return TelemetryFrame(
+            _clamp_non_negative(float(get("Speed") or 0.0)),
+            _clamp_unit(float(get("Throttle") or 0.0)),
+            _clamp_unit(float(get("Brake") or 0.0)),
+            _clamp_finite(float(get("SteeringWheelAngle") or 0.0)),
+            _GEAR_MIN if gear < _GEAR_MIN else _GEAR_MAX if gear > _GEAR_MAX else gear,
+            _clamp_non_negative(float(get("RPM") or 0.0)),
+            # G-force: iRacing gives m/s², convert to g
+            _clamp_finite(float(get("LongAccel") or 0.0) / _G),
+            _clamp_finite(float(get("LatAccel") or 0.0) / _G),
+            _clamp_unit(float(get("LapDistPct") or 0.0)),
+            lap_number if lap_number > 0 else 0,
+            _clamp_non_negative(float(get("LapCurrentLapTime") or 0.0)),
+        )
+
+    def parse_many(self, raws: Iterable[dict]) -> list[TelemetryFrame]:
+        """Parse a batch of raw snapshots; equivalent to ``[parse(r) for r in raws]``.
+
+        The per-frame :meth:`parse` is mapped directly over *raws* (iteration
+        in C, ``self.parse`` bound once).
+        """
+        return list(map(self.parse, raws))
@@ -5,80 +5,230 @@ Schema design notes:
     B-tree key — zero record payload overhead.
   - ``sessions`` lookup table: avoids repeating the session_id string on every
     row (typical UUID/timestamp strings are 10-40 bytes each).
-  - ``throttle``, ``brake``, ``lap_dist_pct`` stored as scaled INTEGER x 10 000:
-    values 0-10 000 fit in 2 bytes vs 8 bytes for REAL.  Precision is 0.0001
-    which exceeds sensor resolution.
+  - Frames are packed into ``frame_chunks`` rows of up to ``_CHUNK_FRAMES``
+    frames keyed by ``(session_idx, lap_number, chunk_idx)``.  One row per
+    chunk instead of one per frame removes the per-row header, varint
+    encoding and B-tree entry that otherwise outweigh the payload.
+  - Chunk payloads are column-major: all ``n`` timestamps, then all ``n``
+    speeds, and so on.  Like values sit next to each other (compressing a
+    little better) and a read unpacks each chunk straight into columns, with
+    no row → column transpose.  Older row-major chunks remain readable.
+  - Databases written before the chunked layout keep their frames in the
+    one-row-per-frame ``telemetry_frames`` table.  That table is never
+    created or written any more, but when present its rows are read back
+    alongside the chunks, so old sessions stay readable.
+  - Chunk payloads are zlib-compressed at level 1 (telemetry channels are
+    piecewise-smooth and compress well for negligible CPU).  A ``codec`` tag
+    per row lets future codecs coexist with existing data.
+  - ``throttle``, ``brake``, ``lap_dist_pct`` stored as scaled int16 x 10 000:
+    values 0-10 000 fit in 2 bytes.  Precision is 0.0001 which exceeds sensor
+    resolution.  The other sensor channels are float32 (the iRacing SDK's own
+    width); only the wall-clock ``timestamp`` keeps float64.
 """
 
 from __future__ import annotations
 
+import functools
+import operator
 import sqlite3
+import struct
+import zlib
+from collections.abc import Iterable, Sequence
+from itertools import chain
 
 from racing_coach.telemetry.models import TelemetryFrame
 
 _SCALE = 10_000  # scaling factor for bounded [0,1] floats
 
+# Frames per chunk row.  96 x 39-byte records = 3.7 KiB, so even an incompressible
+# chunk fits inside one 4 KiB page.
+_CHUNK_FRAMES = 96
+
+# Sealed chunks held in memory before they are written with one executemany()
+# and one commit.  4 x 96 frames is ~6.4 s of 60 Hz telemetry; see _write_pending
+# for the resulting crash-loss window.
+_PENDING_CHUNKS = 4
+
+# One packed frame: timestamp, speed, throttle, brake, steering_angle, gear, rpm,
+# g_force_lon, g_force_lat, lap_dist_pct, lap_time (little-endian, no padding).
+_FRAME = struct.Struct("<dfhhfbfffhf")
+
+
+@functools.lru_cache(maxsize=8)
+def _columnar(n: int) -> struct.Struct:
+    """Struct for *n* frames stored column-major (each _FRAME field repeated *n* times)."""
+    return struct.Struct("<" + "".join(f"{n}{code}" for code in _FRAME.format[1:]))
+
+
+@functools.lru_cache(maxsize=8)
+def _select_laps_chunks(n: int) -> str:
+    """_SELECT_LAPS_CHUNKS with *n* lap-number placeholders."""
+    return _SELECT_LAPS_CHUNKS.format(", ".join("?" * n))
+
+
+def _row_major_columns(data: bytes, n: int) -> list[Sequence]:
+    """Split a row-major payload (``n`` back-to-back _FRAME records) into columns.
+
+    Raises :class:`struct.error` if the payload does not hold exactly *n*
+    records, as :func:`_column_major_columns` does.
+    """
+    if len(data) != n * _FRAME.size:
+        raise struct.error(f"row-major chunk of {len(data)} bytes does not hold {n} frames")
+    return list(zip(*_FRAME.iter_unpack(data), strict=True))
+
+
+def _column_major_columns(data: bytes, n: int) -> list[Sequence]:
+    """Split a column-major payload (see :func:`_columnar`) into columns."""
+    values = _columnar(n).unpack(data)
+    return [values[i : i + n] for i in range(0, len(values), n)]
+
+
+# Payload codec tags stored in frame_chunks.codec
+_CODEC_RAW = 0  # row-major, uncompressed (legacy)
+_CODEC_ZLIB = 1  # row-major, zlib (legacy)
+_CODEC_ZLIB_COLUMNAR = 2  # column-major, zlib
+_ZLIB_LEVEL = 1
+
+# codec → (payload, n_frames) → one sequence per _FRAME field
+_DECODERS = {
+    _CODEC_RAW: lambda payload, n: _row_major_columns(payload, n),
+    _CODEC_ZLIB: lambda payload, n: _row_major_columns(zlib.decompress(payload), n),
+    _CODEC_ZLIB_COLUMNAR: lambda payload, n: _column_major_columns(zlib.decompress(payload), n),
+}
+
 _DDL = """
 PRAGMA journal_mode = WAL;
 PRAGMA synchronous  = NORMAL;
 PRAGMA page_size    = 4096;
+PRAGMA cache_size   = -16384;     -- 16 MiB page cache (negative = KiB)
+PRAGMA mmap_size    = 268435456;  -- memory-map up to 256 MiB for chunk reads
 
 CREATE TABLE IF NOT EXISTS sessions (
     idx        INTEGER PRIMARY KEY,
     session_id TEXT    NOT NULL UNIQUE
 );
 
-CREATE TABLE IF NOT EXISTS telemetry_frames (
-    session_idx    INTEGER NOT NULL,
-    lap_number     INTEGER NOT NULL,
-    timestamp      REAL    NOT NULL,
-    speed          REAL,
-    throttle       INTEGER,
-    brake          INTEGER,
-    steering_angle REAL,
-    gear           INTEGER,
-    rpm            REAL,
-    g_force_lon    REAL,
-    g_force_lat    REAL,
-    lap_dist_pct   INTEGER,
-    lap_time       REAL
+CREATE TABLE IF NOT EXISTS frame_chunks (
+    session_idx INTEGER NOT NULL,
+    lap_number  INTEGER NOT NULL,
+    chunk_idx   INTEGER NOT NULL,
+    n_frames    INTEGER NOT NULL,
+    codec       INTEGER NOT NULL,
+    payload     BLOB    NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_session_lap
-    ON telemetry_frames (session_idx, lap_number);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_chunk_key
+    ON frame_chunks (session_idx, lap_number, chunk_idx);
 """
 
 _INSERT_SESSION = "INSERT OR IGNORE INTO sessions (session_id) VALUES (?)"
 _SELECT_SESSION = "SELECT idx FROM sessions WHERE session_id = ?"
 
-_INSERT_FRAME = """
-INSERT INTO telemetry_frames (
-    session_idx, lap_number, timestamp,
-    speed, throttle, brake, steering_angle, gear, rpm,
-    g_force_lon, g_force_lat, lap_dist_pct, lap_time
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+_INSERT_CHUNK = """
+INSERT INTO frame_chunks (session_idx, lap_number, chunk_idx, n_frames, codec, payload)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_NEXT_CHUNK_IDX = """
+SELECT COALESCE(MAX(chunk_idx) + 1, 0)
+FROM   frame_chunks
+WHERE  session_idx = ? AND lap_number = ?
 """
 
-_SELECT_LAP = """
-SELECT s.session_id,
-       f.lap_number,
-       f.timestamp,
-       f.speed,
-       f.throttle,
-       f.brake,
-       f.steering_angle,
-       f.gear,
-       f.rpm,
-       f.g_force_lon,
-       f.g_force_lat,
-       f.lap_dist_pct,
-       f.lap_time
+_SELECT_CHUNKS = """
+SELECT c.codec, c.n_frames, c.payload
+FROM   frame_chunks c
+JOIN   sessions s ON s.idx = c.session_idx
+WHERE  s.session_id = ? AND c.lap_number = ?
+ORDER  BY c.chunk_idx
+"""
+
+# Same as _SELECT_CHUNKS for several laps at once; the lap numbers are bound as
+# one JSON array so the statement text (and its prepared plan) never changes.
+# Filled in with one "?" per requested lap by _select_laps_chunks().
+_SELECT_LAPS_CHUNKS = """
+SELECT c.lap_number, c.codec, c.n_frames, c.payload
+FROM   frame_chunks c
+JOIN   sessions s ON s.idx = c.session_idx
+WHERE  s.session_id = ? AND c.lap_number IN ({})
+ORDER  BY c.lap_number, c.chunk_idx
+"""
+
+_HAS_LEGACY_FRAMES = (
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'telemetry_frames'"
+)
+
+# Frames from the pre-chunk layout (see module docstring), in _FRAME_COLUMNS
+# order; scaled columns hold the same x _SCALE integers as the chunks.
+_SELECT_LEGACY_LAP = """
+SELECT f.timestamp, f.speed, f.throttle, f.brake, f.steering_angle, f.gear, f.rpm,
+       f.g_force_lon, f.g_force_lat, f.lap_dist_pct, f.lap_time
 FROM   telemetry_frames f
 JOIN   sessions s ON s.idx = f.session_idx
 WHERE  s.session_id = ? AND f.lap_number = ?
 ORDER  BY f.timestamp
 """
 
+# Column names returned by get_lap / get_lap_columns.
+_LAP_COLUMNS: tuple[str, ...] = (
+    "session_id", "lap_number", "timestamp",
+    "speed", "throttle", "brake", "steering_angle", "gear", "rpm",
+    "g_force_lon", "g_force_lat", "lap_dist_pct", "lap_time",
+)
+
+# Columns packed in each _FRAME record, in record order.
+_FRAME_COLUMNS: tuple[str, ...] = _LAP_COLUMNS[2:]
+
+# Columns stored as scaled integers (see module docstring).
+_SCALED_COLUMNS: tuple[str, ...] = ("throttle", "brake", "lap_dist_pct")
+
+
+def _quantize(value: float) -> int:
+    """Scale a [0, 1] value to an int in [0, _SCALE], rounding half up.
+
+    Sensor glitches are clipped: values at or above 1 (including +inf) store
+    as ``_SCALE``; values at or below 0, -inf and NaN store as 0.
+    """
+    if value >= 1.0:
+        return _SCALE
+    if value > 0.0:  # False for NaN
+        return int(value * _SCALE + 0.5)
+    return 0
+
+
+def _decode_columns(
+    session_id: str,
+    lap_number: int,
+    chunks: Iterable[tuple[int, int, bytes]],
+    legacy_rows: list[tuple] | None = None,
+) -> dict[str, list]:
+    """Decode one lap's ``(codec, n_frames, payload)`` chunk rows into column lists.
+
+    *legacy_rows* are the lap's ``telemetry_frames`` rows (see
+    ``_SELECT_LEGACY_LAP``), if any; they are merged in by timestamp.
+    """
+    frame_columns: list[list] = [[] for _ in _FRAME_COLUMNS]
+    if legacy_rows:
+        for column, values in zip(frame_columns, zip(*legacy_rows, strict=True), strict=True):
+            column.extend(values)
+    for codec, n, payload in chunks:
+        for column, values in zip(frame_columns, _DECODERS[codec](payload, n), strict=True):
+            column.extend(values)
+    timestamps = frame_columns[0]
+    n = len(timestamps)
+    if n == 0:
+        return {name: [] for name in _LAP_COLUMNS}
+    if not all(map(operator.le, timestamps, timestamps[1:])):
+        # Out-of-order frames: reorder every column by timestamp (stable).
+        order = sorted(range(n), key=timestamps.__getitem__)
+        frame_columns = [[column[i] for i in order] for column in frame_columns]
+    columns: dict[str, list] = {"session_id": [session_id] * n, "lap_number": [lap_number] * n}
+    columns.update(zip(_FRAME_COLUMNS, frame_columns, strict=True))
+    # Restore scaled integers to floats, one column at a time
+    for name in _SCALED_COLUMNS:
+        columns[name] = [v / _SCALE for v in columns[name]]
+    return columns
+
 
 class TelemetryStorage:
     """Stores and retrieves telemetry frames from a SQLite database.
@@ -90,16 +240,25 @@ class TelemetryStorage:
     """
 
     def __init__(self, db_path: str = "telemetry.db") -> None:
+        # Plain tuple rows: every read unpacks by position, so a Row factory
+        # would only add a per-row allocation.
         self._conn = sqlite3.connect(db_path)
-        self._conn.row_factory = sqlite3.Row
-        for stmt in _DDL.strip().split(";"):
-            stmt = stmt.strip()
-            if stmt:
-                self._conn.execute(stmt)
-        self._conn.commit()
+        self._conn.executescript(_DDL)
+        # One long-lived cursor for every statement: Connection.execute would
+        # create (and discard) a fresh cursor per call.  Every query is fully
+        # fetched before the next one runs, so sharing it is safe.
+        self._cur = self._conn.cursor()
+        self._closed = False
+        self._has_legacy = self._cur.execute(_HAS_LEGACY_FRAMES).fetchone() is not None
         self._session_cache: dict[str, int] = {}
-        self._batch: list[tuple] = []
-        self._batch_size = 600  # flush every ~10 seconds at 60 Hz
+        self._next_chunk: dict[tuple[int, int], int] = {}
+        # Preallocated buffer for the chunk being filled: records are packed in
+        # place at slot _batch_n, so save_frame allocates no per-frame objects.
+        self._batch = bytearray(_CHUNK_FRAMES * _FRAME.size)
+        self._batch_n = 0
+        self._batch_key: tuple[int, int] | None = None
+        # Sealed, compressed chunk rows not yet written (see _seal_chunk).
+        self._pending: list[tuple[int, int, int, int, int, bytes]] = []
 
     # ------------------------------------------------------------------
     # Public API
@@ -113,42 +272,91 @@ class TelemetryStorage:
         frame: TelemetryFrame,
     ) -> None:
         """Persist one telemetry frame.  Writes are batched for performance."""
-        self._batch.append((
-            self._session_idx(session_id),
-            lap_number,
+        key = (self._session_idx(session_id), lap_number)
+        if key != self._batch_key:
+            # A chunk never spans two laps, and a finished lap is committed
+            # right away rather than waiting for _PENDING_CHUNKS to fill.
+            self._flush()
+            self._batch_key = key
+        _FRAME.pack_into(
+            self._batch,
+            self._batch_n * _FRAME.size,
             timestamp,
             frame.speed,
-            round(frame.throttle * _SCALE),
-            round(frame.brake * _SCALE),
+            _quantize(frame.throttle),
+            _quantize(frame.brake),
             frame.steering_angle,
             frame.gear,
             frame.rpm,
             frame.g_force_lon,
             frame.g_force_lat,
-            round(frame.lap_dist_pct * _SCALE),
+            _quantize(frame.lap_dist_pct),
             frame.lap_time,
-        ))
-        if len(self._batch) >= self._batch_size:
-            self._flush()
+        )
+        self._batch_n += 1
+        if self._batch_n >= _CHUNK_FRAMES:
+            self._seal_chunk()
 
     def get_lap(self, session_id: str, lap_number: int) -> list[dict]:
-        """Return all frames for *session_id* / *lap_number*, ordered by timestamp."""
+        """Return all frames for *session_id* / *lap_number*, ordered by timestamp.
+
+        Float channels other than ``timestamp`` (float64) and the scaled
+        ``throttle`` / ``brake`` / ``lap_dist_pct`` (0.0001 steps), including
+        ``lap_time``, are stored as float32 and come back rounded to it.
+        """
+        columns = self.get_lap_columns(session_id, lap_number)
+        return [
+            dict(zip(columns, values, strict=True))
+            for values in zip(*columns.values(), strict=True)
+        ]
+
+    def get_lap_columns(self, session_id: str, lap_number: int) -> dict[str, list]:
+        """Return the frames for *session_id* / *lap_number* in column-oriented form.
+
+        The result maps each column name to a list of values ordered by
+        timestamp.  All lists have the same length (0 if the lap is missing).
+        """
         self._flush()
-        cursor = self._conn.execute(_SELECT_LAP, (session_id, lap_number))
-        result = []
-        for row in cursor.fetchall():
-            d = dict(row)
-            # Restore scaled integers to floats
-            d["throttle"] = d["throttle"] / _SCALE
-            d["brake"] = d["brake"] / _SCALE
-            d["lap_dist_pct"] = d["lap_dist_pct"] / _SCALE
-            result.append(d)
-        return result
+        rows = self._cur.execute(_SELECT_CHUNKS, (session_id, lap_number)).fetchall()
+        return _decode_columns(
+            session_id, lap_number, rows, self._legacy_rows(session_id, lap_number)
+        )
 
-    def close(self) -> None:
-        """Flush buffered writes and close the database connection."""
+    def get_laps_columns(
+        self, session_id: str, lap_numbers: Iterable[int]
+    ) -> dict[int, dict[str, list]]:
+        """Return :meth:`get_lap_columns` for several laps in one query.
+
+        The result maps each requested lap number to its columns; laps with no
+        frames map to empty columns.
+        """
         self._flush()
-        self._conn.close()
+        laps = list(dict.fromkeys(lap_numbers))
+        rows = self._cur.execute(_select_laps_chunks(len(laps)), (session_id, *laps)).fetchall()
+        chunks: dict[int, list[tuple[int, int, bytes]]] = {lap: [] for lap in laps}
+        for lap, codec, n_frames, payload in rows:
+            chunks[lap].append((codec, n_frames, payload))
+        return {
+            lap: _decode_columns(session_id, lap, chunks[lap], self._legacy_rows(session_id, lap))
+            for lap in laps
+        }
+
+    def close(self) -> None:
+        """Flush buffered writes and close the database connection.
+
+        The WAL is checkpointed and truncated first, so the main database file
+        alone holds every frame once the storage is closed.  The connection is
+        closed even if the flush or checkpoint raises; calling ``close()``
+        again is a no-op.
+        """
+        if self._closed:
+            return
+        try:
+            self._flush()
+            self._cur.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            self._conn.close()
+            self._closed = True
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -158,14 +366,65 @@ class TelemetryStorage:
         """Return the integer PK for *session_id*, creating a row if needed."""
         if session_id not in self._session_cache:
             self._flush()  # commit any pending batch before touching sessions
-            self._conn.execute(_INSERT_SESSION, (session_id,))
+            self._cur.execute(_INSERT_SESSION, (session_id,))
             self._conn.commit()
-            row = self._conn.execute(_SELECT_SESSION, (session_id,)).fetchone()
+            row = self._cur.execute(_SELECT_SESSION, (session_id,)).fetchone()
             self._session_cache[session_id] = row[0]
         return self._session_cache[session_id]
 
-    def _flush(self) -> None:
-        if self._batch:
-            self._conn.executemany(_INSERT_FRAME, self._batch)
+    def _legacy_rows(self, session_id: str, lap_number: int) -> list[tuple] | None:
+        """Return the lap's rows from the pre-chunk ``telemetry_frames`` table, if any."""
+        if not self._has_legacy:
+            return None
+        return self._cur.execute(_SELECT_LEGACY_LAP, (session_id, lap_number)).fetchall()
+
+    def _chunk_idx(self, key: tuple[int, int]) -> int:
+        """Return the next free chunk index for *key* = (session_idx, lap_number)."""
+        idx = self._next_chunk.get(key)
+        if idx is None:
+            idx = self._cur.execute(_NEXT_CHUNK_IDX, key).fetchone()[0]
+        self._next_chunk[key] = idx + 1
+        return idx
+
+    def _seal_chunk(self) -> None:
+        """Compress the chunk being filled into a pending row.
+
+        Pending rows are written in bulk once ``_PENDING_CHUNKS`` accumulate
+        (or at the next lap change / read / close), so a lap costs a handful
+        of transactions instead of one per chunk.
+        """
+        n = self._batch_n
+        if n:
+            session_idx, lap_number = self._batch_key
+            # Transpose the packed records into the column-major layout.
+            records = _FRAME.iter_unpack(memoryview(self._batch)[: n * _FRAME.size])
+            payload = _columnar(n).pack(*chain.from_iterable(zip(*records, strict=True)))
+            self._pending.append((
+                session_idx,
+                lap_number,
+                self._chunk_idx(self._batch_key),
+                n,
+                _CODEC_ZLIB_COLUMNAR,
+                zlib.compress(payload, _ZLIB_LEVEL),
+            ))
+            self._batch_n = 0
+            if len(self._pending) >= _PENDING_CHUNKS:
+                self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Insert all pending chunk rows in a single transaction.
+
+        Until this runs, frames exist only in memory.  A crash therefore loses
+        at most ``_PENDING_CHUNKS`` sealed chunks plus the chunk being filled,
+        ``(_PENDING_CHUNKS + 1) x _CHUNK_FRAMES - 1`` frames (479, about 8 s at
+        60 Hz), and never frames from an earlier lap (lap changes flush).
+        """
+        if self._pending:
+            self._cur.executemany(_INSERT_CHUNK, self._pending)
             self._conn.commit()
-            self._batch.clear()
+            self._pending.clear()
+
+    def _flush(self) -> None:
+        """Make every saved frame durable and visible to queries."""
+        self._seal_chunk()
+        self._write_pending()
@@ -6,8 +6,7 @@ smooth, closed centerline suitable for curvature analysis.
 
 from __future__ import annotations
 
-from collections import defaultdict
-
+from racing_coach.track.detector import _moving_average
 from racing_coach.track.models import TrackPoint
 
 
@@ -52,24 +51,28 @@ class CenterlineExtractor:
         if not laps:
             raise ValueError("At least one lap is required")
 
-        # Step 1 — collect samples per bin
-        x_accum: dict[int, list[float]] = defaultdict(list)
-        y_accum: dict[int, list[float]] = defaultdict(list)
+        # Step 1 — accumulate running sums per bin.  Flat, preallocated
+        # accumulators keep the working set at 3 x n_bins values no matter how
+        # many laps are averaged (no per-bin sample lists).
+        n_bins = self.n_bins
+        x_sum = [0.0] * n_bins
+        y_sum = [0.0] * n_bins
+        count = [0] * n_bins
 
         for lap in laps:
             for pt in lap:
-                idx = int(pt.lap_dist_pct * self.n_bins) % self.n_bins
-                x_accum[idx].append(pt.x)
-                y_accum[idx].append(pt.y)
+                idx = int(pt.lap_dist_pct * n_bins) % n_bins
+                x_sum[idx] += pt.x
+                y_sum[idx] += pt.y
+                count[idx] += 1
 
         # Step 2 — average per bin
         raw: list[TrackPoint] = []
-        for i in range(self.n_bins):
-            if x_accum[i]:
-                x_avg = sum(x_accum[i]) / len(x_accum[i])
-                y_avg = sum(y_accum[i]) / len(y_accum[i])
-                t = (i + 0.5) / self.n_bins
-                raw.append(TrackPoint(lap_dist_pct=t, x=x_avg, y=y_avg))
+        for i in range(n_bins):
+            c = count[i]
+            if c:
+                t = (i + 0.5) / n_bins
+                raw.append(TrackPoint(lap_dist_pct=t, x=x_sum[i] / c, y=y_sum[i] / c))
 
         if not raw:
             return []
@@ -84,23 +87,11 @@ class CenterlineExtractor:
     # ------------------------------------------------------------------
 
     def _smooth(self, points: list[TrackPoint]) -> list[TrackPoint]:
-        """Circular moving-average over x and y."""
-        n = len(points)
+        """Circular moving-average over x and y (O(n), see :func:`_moving_average`)."""
         w = self.smooth_window
-        kernel_size = 2 * w + 1
-        smoothed: list[TrackPoint] = []
-
-        for i in range(n):
-            x_sum = 0.0
-            y_sum = 0.0
-            for j in range(-w, w + 1):
-                pt = points[(i + j) % n]
-                x_sum += pt.x
-                y_sum += pt.y
-            smoothed.append(TrackPoint(
-                lap_dist_pct=points[i].lap_dist_pct,
-                x=x_sum / kernel_size,
-                y=y_sum / kernel_size,
-            ))
-
-        return smoothed
+        xs = _moving_average([pt.x for pt in points], w)
+        ys = _moving_average([pt.y for pt in points], w)
+        return [
+            TrackPoint(lap_dist_pct=pt.lap_dist_pct, x=x, y=y)
+            for pt, x, y in zip(points, xs, ys, strict=True)
+        ]
@@ -7,51 +7,75 @@ S2-US3: subdivide each corner into Entry / Apex / Exit phases.
 from __future__ import annotations
 
 import math
+import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 
 from racing_coach.track.models import Corner, TrackPoint
 
+# Maximal runs of one turning state in the quantized curvature buffer
+# (see CornerDetector._find_regions): b"\x01" = left, b"\x02" = right.
+_CORNER_RUNS = re.compile(rb"\x01+|\x02+")
+
 # ---------------------------------------------------------------------------
 # Geometry primitives
 # ---------------------------------------------------------------------------
 
-def _menger_signed_curvature(p1: TrackPoint, p2: TrackPoint, p3: TrackPoint) -> float:
-    """Signed Menger curvature at *p2* given three consecutive track points.
+def _signed_curvatures(xs: list[float], ys: list[float]) -> list[float]:
+    """Signed Menger curvature at every point of a closed polyline.
+
+    Point *i* is evaluated on the triangle (P[i-1], P[i], P[i+1]) with circular
+    wraparound at both ends.  The neighbour coordinates are built once as
+    rotated copies of *xs* / *ys*, so the whole centerline is processed in a
+    single ``zip`` pass without per-point function calls or attribute loads.
 
     Returns the physical curvature κ = 1/R with sign:
       * positive → left turn (counterclockwise)
       * negative → right turn (clockwise)
 
-    Returns 0.0 if any two points are coincident (degenerate triangle).
+    A point whose triangle is degenerate (two coincident points) gets 0.0.
     """
-    ax, ay = p2.x - p1.x, p2.y - p1.y  # vector P1→P2
-    bx, by = p3.x - p2.x, p3.y - p2.y  # vector P2→P3
-    cx, cy = p3.x - p1.x, p3.y - p1.y  # vector P1→P3
-
-    d12 = math.hypot(ax, ay)
-    d23 = math.hypot(bx, by)
-    d13 = math.hypot(cx, cy)
-
-    denom = d12 * d23 * d13
-    if denom < 1e-12:
-        return 0.0
-
-    # z-component of cross(P2-P1, P3-P2): positive means CCW (left turn)
-    cross_z = ax * by - ay * bx
-    return 2.0 * cross_z / denom
+    x1 = xs[-1:] + xs[:-1]  # P1 = previous point
+    y1 = ys[-1:] + ys[:-1]
+    x3 = xs[1:] + xs[:1]  # P3 = next point
+    y3 = ys[1:] + ys[:1]
+
+    sqrt = math.sqrt
+    out: list[float] = []
+    append = out.append
+    for p1x, p1y, p2x, p2y, p3x, p3y in zip(x1, y1, xs, ys, x3, y3, strict=True):
+        ax, ay = p2x - p1x, p2y - p1y  # vector P1→P2
+        bx, by = p3x - p2x, p3y - p2y  # vector P2→P3
+        cx, cy = p3x - p1x, p3y - p1y  # vector P1→P3
+
+        # |a|·|b|·|c| as one sqrt of the squared lengths.  hypot's overflow-safe
+        # scaling is unnecessary for track coordinates (metres, |v| << 1e100).
+        denom2 = (ax * ax + ay * ay) * (bx * bx + by * by) * (cx * cx + cy * cy)
+        if denom2 < 1e-24:
+            append(0.0)
+        else:
+            # z-component of cross(P2-P1, P3-P2): positive means CCW (left turn)
+            append(2.0 * (ax * by - ay * bx) / sqrt(denom2))
+    return out
 
 
 def _moving_average(values: list[float], half_window: int) -> list[float]:
-    """Circular moving average with kernel size ``2 * half_window + 1``."""
+    """Circular moving average with kernel size ``2 * half_window + 1``.
+
+    O(n) box filter over a prefix sum of the circularly padded input: each
+    output is one difference of two prefix sums.  ``itertools.accumulate``
+    runs the summation in C, so the only Python-level pass is the final
+    list comprehension.
+    """
     n = len(values)
     if n == 0:
         return []
     w = half_window
     kernel = 2 * w + 1
-    result: list[float] = []
-    for i in range(n):
-        total = sum(values[(i + j) % n] for j in range(-w, w + 1))
-        result.append(total / kernel)
-    return result
+    head = [values[j % n] for j in range(-w, 0)]
+    tail = [values[j % n] for j in range(n, n + w)]
+    prefix = list(accumulate(head + values + tail, initial=0.0))
+    return [(hi - lo) / kernel for lo, hi in zip(prefix, prefix[kernel:], strict=False)]
 
 
 # ---------------------------------------------------------------------------
@@ -105,31 +129,32 @@ class CornerDetector:
         if len(centerline) < 3:
             return []
 
-        n = len(centerline)
+        # 0. Unpack the TrackPoints once into parallel coordinate arrays (SoA);
+        #    every numeric stage below works on plain float lists.
+        pcts = [p.lap_dist_pct for p in centerline]
+        xs = [p.x for p in centerline]
+        ys = [p.y for p in centerline]
 
         # 1. Signed curvature at each point (with circular wraparound at endpoints)
-        raw_k: list[float] = [0.0] * n
-        raw_k[0] = _menger_signed_curvature(centerline[-1], centerline[0], centerline[1])
-        for i in range(1, n - 1):
-            raw_k[i] = _menger_signed_curvature(centerline[i - 1], centerline[i], centerline[i + 1])
-        raw_k[-1] = _menger_signed_curvature(centerline[-2], centerline[-1], centerline[0])
+        raw_k = _signed_curvatures(xs, ys)
 
         # 2. Smooth curvature
         curvatures: list[float] = _moving_average(raw_k, self.smooth_window)
+        abs_k = [abs(k) for k in curvatures]  # shared by every corner's apex search
 
         # 3. Find corner regions (above threshold, split at sign changes)
-        regions = self._find_regions(curvatures, centerline)
+        regions = self._find_regions(curvatures, pcts)
 
         # 4. Filter short regions
         regions = [(s, e) for s, e in regions if (e - s) >= self.min_corner_fraction]
 
         # 5. Merge nearby same-direction regions
-        regions = self._merge_regions(regions, curvatures, centerline)
+        regions = self._merge_regions(regions, curvatures, pcts)
 
         # 6. Build Corner objects with three-phase division
         corners: list[Corner] = []
         for cid, (start_pct, end_pct) in enumerate(regions, start=1):
-            corner = self._build_corner(cid, start_pct, end_pct, centerline, curvatures)
+            corner = self._build_corner(cid, start_pct, end_pct, pcts, curvatures, abs_k)
             if corner is not None:
                 corners.append(corner)
 
@@ -142,43 +167,26 @@ class CornerDetector:
     def _find_regions(
         self,
         curvatures: list[float],
-        centerline: list[TrackPoint],
+        pcts: list[float],
     ) -> list[tuple[float, float]]:
         """Return (start_pct, end_pct) pairs where |κ| > threshold.
 
         Regions are split whenever the curvature sign changes, so that an S-bend
         yields two separate regions with opposite directions.
+
+        Each point is quantized to one byte (0 = straight, 1 = left, 2 = right);
+        regions are then the runs of a single non-zero state, located by a
+        compiled regex over that compact buffer so the scan runs in C.
         """
-        n = len(curvatures)
+        thr = self.curvature_threshold
+        states = bytes([(k > thr) + 2 * (k < -thr) for k in curvatures])
+
         regions: list[tuple[float, float]] = []
-        i = 0
-
-        while i < n:
-            # Skip below-threshold points
-            while i < n and abs(curvatures[i]) <= self.curvature_threshold:
-                i += 1
-            if i >= n:
-                break
-
-            # Start of a corner region
-            start_i = i
-            current_positive = curvatures[i] > 0
-
-            # Extend while above threshold AND same sign
-            while i < n:
-                k = curvatures[i]
-                if abs(k) <= self.curvature_threshold:
-                    break  # dropped below threshold
-                if (k > 0) != current_positive:
-                    break  # sign change → start a new region next iteration
-                i += 1
-
-            end_i = i - 1
-            start_pct = centerline[start_i].lap_dist_pct
-            end_pct = centerline[end_i].lap_dist_pct
+        for run in _CORNER_RUNS.finditer(states):
+            start_pct = pcts[run.start()]
+            end_pct = pcts[run.end() - 1]
             if end_pct > start_pct:
                 regions.append((start_pct, end_pct))
-            # Do NOT increment i here; the loop re-enters at the sign-change boundary
 
         return regions
 
@@ -186,37 +194,42 @@ class CornerDetector:
         self,
         region: tuple[float, float],
         curvatures: list[float],
-        centerline: list[TrackPoint],
+        pcts: list[float],
     ) -> str:
         """Return ``'L'`` or ``'R'`` for the dominant curvature sign in a region."""
         start_pct, end_pct = region
-        total = sum(
-            curvatures[i]
-            for i, pt in enumerate(centerline)
-            if start_pct <= pt.lap_dist_pct <= end_pct
-        )
+        lo = bisect_left(pcts, start_pct)
+        hi = bisect_right(pcts, end_pct, lo)
+        total = sum(curvatures[lo:hi])
         return "L" if total >= 0 else "R"
 
     def _merge_regions(
         self,
         regions: list[tuple[float, float]],
         curvatures: list[float],
-        centerline: list[TrackPoint],
+        pcts: list[float],
     ) -> list[tuple[float, float]]:
-        """Merge adjacent same-direction regions separated by a tiny gap."""
+        """Merge adjacent same-direction regions separated by a tiny gap.
+
+        Each region's direction is computed once up front; only a merged region
+        (whose span now includes the gap) needs its direction recomputed.
+        """
         if not regions:
             return regions
 
+        max_gap = self.merge_gap
+        dirs = [self._region_direction(r, curvatures, pcts) for r in regions]
         merged = [regions[0]]
-        for r in regions[1:]:
+        merged_dirs = [dirs[0]]
+        for r, curr_dir in zip(regions[1:], dirs[1:], strict=True):
             prev = merged[-1]
             gap = r[0] - prev[1]
-            prev_dir = self._region_direction(prev, curvatures, centerline)
-            curr_dir = self._region_direction(r, curvatures, centerline)
-            if gap < self.merge_gap and prev_dir == curr_dir:
+            if gap < max_gap and merged_dirs[-1] == curr_dir:
                 merged[-1] = (prev[0], r[1])
+                merged_dirs[-1] = self._region_direction(merged[-1], curvatures, pcts)
             else:
                 merged.append(r)
+                merged_dirs.append(curr_dir)
         return merged
 
     def _build_corner(
@@ -224,31 +237,34 @@ class CornerDetector:
         cid: int,
         entry_pct: float,
         exit_pct: float,
-        centerline: list[TrackPoint],
+        pcts: list[float],
         curvatures: list[float],
+        abs_k: list[float],
     ) -> Corner | None:
-        """Construct a :class:`Corner` with three-phase division."""
-        indices = [
-            i
-            for i, pt in enumerate(centerline)
-            if entry_pct <= pt.lap_dist_pct <= exit_pct
-        ]
-        if not indices:
+        """Construct a :class:`Corner` with three-phase division.
+
+        *pcts* is ascending, so the corner's points are the contiguous index
+        range found by bisection rather than by scanning the whole lap.
+        """
+        lo = bisect_left(pcts, entry_pct)
+        hi = bisect_right(pcts, exit_pct, lo)
+        if lo >= hi:
             return None
+        mags = abs_k[lo:hi]
 
-        # Apex = point of maximum |curvature|
-        apex_idx = max(indices, key=lambda i: abs(curvatures[i]))
-        apex_pct = centerline[apex_idx].lap_dist_pct
+        # Apex = point of maximum |curvature| (first one on ties)
+        peak_k = max(mags)
+        apex_idx = lo + mags.index(peak_k)
+        apex_pct = pcts[apex_idx]
         direction = "L" if curvatures[apex_idx] >= 0 else "R"
 
         # Apex zone = all indices within the corner where |κ| >= fraction * peak
-        peak_k = abs(curvatures[apex_idx])
         apex_threshold = self.apex_fraction * peak_k
 
-        apex_zone = [i for i in indices if abs(curvatures[i]) >= apex_threshold]
+        apex_zone = [j for j, m in enumerate(mags) if m >= apex_threshold]
         if apex_zone:
-            apex_start = centerline[min(apex_zone)].lap_dist_pct
-            apex_end = centerline[max(apex_zone)].lap_dist_pct
+            apex_start = pcts[lo + apex_zone[0]]
+            apex_end = pcts[lo + apex_zone[-1]]
         else:
             apex_start = apex_pct
             apex_end = apex_pct
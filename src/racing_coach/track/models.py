@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackPoint:
     """A single point on the track centerline.
 
@@ -23,7 +23,7 @@ class TrackPoint:
     """Y coordinate."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Corner:
     """A detected corner with entry/apex/exit three-phase division.
 
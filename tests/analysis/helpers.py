@@ -0,0 +1,28 @@
+"""Shared test-data helpers for the analysis tests."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable, Sequence
+
+from racing_coach.analysis.models import LapFrame
+
+# The six LapFrame fields as parallel sequences, in LapFrame.from_arrays order.
+LapColumns = tuple[Sequence[float], ...]
+
+
+def cached_lap(build: Callable[..., LapColumns]) -> Callable[..., list[LapFrame]]:
+    """Turn a builder of immutable lap columns into a factory of fresh laps.
+
+    *build* runs once per argument set and must return tuples, which are
+    shared between callers; every call of the returned factory creates new
+    :class:`LapFrame` objects, so a test that mutates its lap cannot leak
+    into another test.
+    """
+    columns = functools.lru_cache(maxsize=32)(build)
+
+    @functools.wraps(build)
+    def make(*args: object, **kwargs: object) -> list[LapFrame]:
+        return LapFrame.from_arrays(*columns(*args, **kwargs))
+
+    return make
@@ -141,3 +141,12 @@ class TestApexSpeedAnalysis:
         lap = make_lap_with_apex_speed()
         results = self._analyzer().analyze(lap, lap, [self.CORNER])
         assert results[0].corner_id == self.CORNER.id
+
+    def test_spin_back_into_apex_zone_is_seen(self):
+        """Frames after lap_dist_pct runs backwards (a spin) still count."""
+        lap = make_lap_with_apex_speed(min_speed_mps=20.0)
+        lap.append(LapFrame(lap_dist_pct=0.35, lap_time=61.0, speed=3.0,
+                            throttle=0.0, brake=0.0, steering_angle=0.0))
+        ref = make_lap_with_apex_speed(min_speed_mps=20.0)
+        results = self._analyzer().analyze(lap, ref, [self.CORNER])
+        assert results[0].min_speed_mps == 3.0
@@ -2,27 +2,39 @@
 
 from __future__ import annotations
 
+import dataclasses
+from math import isclose
+
+import pytest
+
 from racing_coach.analysis.delta import DeltaCalculator
 from racing_coach.analysis.models import LapFrame
 from racing_coach.track.models import Corner
+from tests.analysis.helpers import LapColumns, cached_lap
+
+pytestmark = pytest.mark.cpu_analysis
 
 # ---------------------------------------------------------------------------
 # Test-data helpers
 # ---------------------------------------------------------------------------
 
-def make_uniform_lap(n: int = 101, total_time: float = 60.0, speed: float = 50.0) -> list[LapFrame]:
+@cached_lap
+def make_uniform_lap(n: int = 101, total_time: float = 60.0, speed: float = 50.0) -> LapColumns:
     """Lap with uniform speed: lap_time grows linearly from 0 to total_time."""
-    return [
-        LapFrame(
-            lap_dist_pct=i / (n - 1),
-            lap_time=i / (n - 1) * total_time,
-            speed=speed,
-            throttle=0.8,
-            brake=0.0,
-            steering_angle=0.0,
-        )
-        for i in range(n)
-    ]
+    pcts = tuple(i / (n - 1) for i in range(n))
+    return (
+        pcts,
+        tuple(p * total_time for p in pcts),
+        (speed,) * n,
+        (0.8,) * n,
+        (0.0,) * n,
+        (0.0,) * n,
+    )
+
+
+def expected_delta(p: float, user_total: float, ref_total: float) -> float:
+    """Exact delta at *p* between two uniform-speed laps (both times are linear in p)."""
+    return p * (user_total - ref_total)
 
 
 def make_three_corners() -> list[Corner]:
@@ -36,22 +48,33 @@ def make_three_corners() -> list[Corner]:
     ]
 
 
+@pytest.fixture
+def ref_lap() -> list[LapFrame]:
+    """Default 60 s reference lap; fresh frames for every test."""
+    return make_uniform_lap()
+
+
+@pytest.fixture(scope="module")
+def three_corners() -> list[Corner]:
+    return make_three_corners()
+
+
 # ---------------------------------------------------------------------------
 # S3-US2: Point-by-point delta
 # ---------------------------------------------------------------------------
 
 class TestDeltaCalculator:
-    def test_same_lap_zero_delta(self):
+    def test_same_lap_zero_delta(self, ref_lap):
         """Comparing a lap to itself gives delta ≈ 0 everywhere."""
-        lap = make_uniform_lap()
+        lap = ref_lap
         calc = DeltaCalculator()
         deltas = calc.compute_point_deltas(lap, lap)
         for _, d in deltas:
-            assert abs(d) < 0.01
+            assert isclose(d, 0.0, abs_tol=0.01)
 
-    def test_all_positive_when_slower(self):
+    def test_all_positive_when_slower(self, ref_lap):
         """User lap slower than reference → positive delta at every position p > 0."""
-        ref = make_uniform_lap(total_time=60.0)
+        ref = ref_lap
         user = make_uniform_lap(total_time=62.0)
         calc = DeltaCalculator()
         deltas = calc.compute_point_deltas(user, ref)
@@ -59,9 +82,9 @@ class TestDeltaCalculator:
             if p > 1e-6:
                 assert d > 0, f"Expected positive delta at p={p:.3f}, got {d:.4f}"
 
-    def test_all_negative_when_faster(self):
+    def test_all_negative_when_faster(self, ref_lap):
         """User lap faster than reference → negative delta at every position p > 0."""
-        ref = make_uniform_lap(total_time=60.0)
+        ref = ref_lap
         user = make_uniform_lap(total_time=58.0)
         calc = DeltaCalculator()
         deltas = calc.compute_point_deltas(user, ref)
@@ -69,14 +92,15 @@ class TestDeltaCalculator:
             if p > 1e-6:
                 assert d < 0, f"Expected negative delta at p={p:.3f}, got {d:.4f}"
 
-    def test_delta_matches_known_value_at_midpoint(self):
+    def test_delta_matches_known_value_at_midpoint(self, ref_lap):
         """For 1-second-slower lap, delta at p=0.5 is approximately 0.5 s."""
-        ref = make_uniform_lap(n=101, total_time=60.0)
+        ref = ref_lap
         user = make_uniform_lap(n=101, total_time=61.0)
         calc = DeltaCalculator()
         deltas = calc.compute_point_deltas(user, ref)
-        mid_delta = next(d for p, d in deltas if abs(p - 0.5) < 0.02)
-        assert abs(mid_delta - 0.5) < 0.05
+        p, mid_delta = deltas[(calc.n_grid - 1) // 2]  # grid point at p = 0.5
+        assert p == pytest.approx(0.5)
+        assert mid_delta == pytest.approx(expected_delta(p, 61.0, 60.0), abs=1e-9)
 
     def test_different_sample_rates(self):
         """Interpolation works when user (100 frames) and ref (60 frames) differ."""
@@ -88,10 +112,11 @@ class TestDeltaCalculator:
         for p, d in deltas:
             if p > 1e-6:
                 assert d > 0
+            assert d == pytest.approx(expected_delta(p, 61.0, 60.0), abs=1e-9)
 
-    def test_output_length_equals_grid_size(self):
+    def test_output_length_equals_grid_size(self, ref_lap):
         """The returned deltas list has n_grid entries."""
-        lap = make_uniform_lap()
+        lap = ref_lap
         calc = DeltaCalculator(n_grid=50)
         deltas = calc.compute_point_deltas(lap, lap)
         assert len(deltas) == 50
@@ -100,18 +125,18 @@ class TestDeltaCalculator:
     # Per-corner delta summary
     # ------------------------------------------------------------------
 
-    def test_three_corner_delta_summary(self):
+    def test_three_corner_delta_summary(self, ref_lap, three_corners):
         """compute_corner_deltas returns one CornerDelta per corner."""
-        ref = make_uniform_lap()
+        ref = ref_lap
         user = make_uniform_lap(total_time=61.0)
-        corners = make_three_corners()
+        corners = three_corners
         calc = DeltaCalculator()
         result = calc.compute_corner_deltas(user, ref, corners)
         assert len(result) == 3
 
-    def test_corner_delta_ids_match(self):
+    def test_corner_delta_ids_match(self, ref_lap):
         """CornerDelta.corner_id matches the input Corner.id."""
-        ref = make_uniform_lap()
+        ref = ref_lap
         user = make_uniform_lap(total_time=61.0)
         corners = [Corner(id=7, entry_pct=0.2, apex_pct=0.25, exit_pct=0.3,
                           direction="L", apex_start=0.23, apex_end=0.27)]
@@ -119,23 +144,21 @@ class TestDeltaCalculator:
         result = calc.compute_corner_deltas(user, ref, corners)
         assert result[0].corner_id == 7
 
-    def test_corner_delta_has_all_fields(self):
+    def test_corner_delta_has_all_fields(self, ref_lap, three_corners):
         """CornerDelta contains delta_entry, delta_apex, delta_exit, delta_total."""
-        ref = make_uniform_lap()
+        ref = ref_lap
         user = make_uniform_lap(total_time=61.0)
-        corners = make_three_corners()
+        corners = three_corners
         calc = DeltaCalculator()
+        required = {"delta_entry", "delta_apex", "delta_exit", "delta_total"}
         for cd in calc.compute_corner_deltas(user, ref, corners):
-            assert hasattr(cd, "delta_entry")
-            assert hasattr(cd, "delta_apex")
-            assert hasattr(cd, "delta_exit")
-            assert hasattr(cd, "delta_total")
+            assert required <= {f.name for f in dataclasses.fields(cd)}
 
-    def test_delta_total_equals_exit_minus_entry(self):
+    def test_delta_total_equals_exit_minus_entry(self, ref_lap, three_corners):
         """delta_total = delta_exit - delta_entry (time gained/lost in this corner)."""
-        ref = make_uniform_lap()
+        ref = ref_lap
         user = make_uniform_lap(total_time=62.0)
-        corners = make_three_corners()
+        corners = three_corners
         calc = DeltaCalculator()
         for cd in calc.compute_corner_deltas(user, ref, corners):
-            assert abs(cd.delta_total - (cd.delta_exit - cd.delta_entry)) < 0.01
+            assert isclose(cd.delta_total, cd.delta_exit - cd.delta_entry, abs_tol=0.01)
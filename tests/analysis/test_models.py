@@ -0,0 +1,66 @@
+"""Tests for analysis model helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from racing_coach.analysis.models import LapFrame, frames_between, is_pct_ordered
+from racing_coach.telemetry.models import TelemetryFrame
+from racing_coach.telemetry.storage import TelemetryStorage
+
+
+def make_lap(n: int = 11) -> list[LapFrame]:
+    return [
+        LapFrame(lap_dist_pct=i / (n - 1), lap_time=float(i), speed=50.0,
+                 throttle=0.0, brake=0.0, steering_angle=0.0)
+        for i in range(n)
+    ]
+
+
+def test_frames_between_is_inclusive_on_both_ends():
+    lap = make_lap()
+    window = frames_between(lap, 0.2, 0.5)
+    assert [f.lap_time for f in window] == [2.0, 3.0, 4.0, 5.0]
+
+
+def test_frames_between_matches_linear_filter():
+    lap = make_lap(101)
+    for lo, hi in [(0.0, 1.0), (0.333, 0.667), (0.5, 0.5), (0.71, 0.7), (-1.0, 2.0)]:
+        expected = [f for f in lap if lo <= f.lap_dist_pct <= hi]
+        assert frames_between(lap, lo, hi) == expected
+
+
+def test_frames_between_handles_a_wrapped_lap():
+    """Frames past the start/finish line (0.99 → 0.0) are not lost to the bisect."""
+    lap = make_lap(11) + [
+        LapFrame(lap_dist_pct=p, lap_time=10.0 + i, speed=50.0,
+                 throttle=0.0, brake=0.0, steering_angle=0.0)
+        for i, p in enumerate((0.0, 0.05, 0.1), start=1)
+    ]
+    assert not is_pct_ordered(lap)
+    assert is_pct_ordered(make_lap())
+    for lo, hi in [(0.0, 0.1), (0.05, 0.5), (0.9, 1.0)]:
+        expected = [f for f in lap if lo <= f.lap_dist_pct <= hi]
+        assert frames_between(lap, lo, hi) == expected
+    assert [f.lap_time for f in frames_between(lap, 0.0, 0.1)] == [0.0, 1.0, 11.0, 12.0, 13.0]
+
+
+@pytest.fixture
+def storage():
+    s = TelemetryStorage(":memory:")
+    yield s
+    s.close()
+
+
+def test_from_storage_columns_matches_from_storage_dict(storage):
+    for i in range(5):
+        frame = TelemetryFrame(
+            speed=40.0 + i, throttle=0.1 * i, brake=0.05 * i, steering_angle=-0.1 * i,
+            gear=3, rpm=6000.0, g_force_lon=0.0, g_force_lat=0.0,
+            lap_dist_pct=i / 10, lap_time=0.5 * i, lap_number=1,
+        )
+        storage.save_frame("s1", 1, float(i), frame)
+
+    frames = LapFrame.from_storage_columns(storage.get_lap_columns("s1", 1))
+    assert frames == [LapFrame.from_storage_dict(r) for r in storage.get_lap("s1", 1)]
+    assert LapFrame.from_storage_columns(storage.get_lap_columns("s1", 2)) == []
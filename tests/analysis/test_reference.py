@@ -6,15 +6,32 @@ import pytest
 
 from racing_coach.analysis.reference import ReferenceLapManager
 
+pytestmark = pytest.mark.io_reference
+
+
+@pytest.fixture(scope="module")
+def template():
+    """An empty, fully initialised database shared by the whole module."""
+    m = ReferenceLapManager(":memory:")
+    yield m
+    m.close()
+
+
+@pytest.fixture
+def mgr(template):
+    """A fresh in-memory copy of the template for every test."""
+    m = template.copy_to_memory()
+    yield m
+    m.close()
+
 
 class TestReferenceLapManagement:
     # ------------------------------------------------------------------
     # record + set + get
     # ------------------------------------------------------------------
 
-    def test_record_and_get_reference(self):
+    def test_record_and_get_reference(self, mgr):
         """Mark a lap as reference and retrieve it."""
-        mgr = ReferenceLapManager(":memory:")
         mgr.record_lap("sess1", 1, "spa", "gt3", 120.5)
         mgr.set_reference("sess1", 1)
         ref = mgr.get_reference("spa", "gt3")
@@ -22,22 +39,19 @@ class TestReferenceLapManagement:
         assert ref["session_id"] == "sess1"
         assert ref["lap_number"] == 1
 
-    def test_is_reference_flag_is_true(self):
+    def test_is_reference_flag_is_true(self, mgr):
         """is_reference field equals True after set_reference."""
-        mgr = ReferenceLapManager(":memory:")
         mgr.record_lap("sess1", 1, "spa", "gt3", 120.5)
         mgr.set_reference("sess1", 1)
         ref = mgr.get_reference("spa", "gt3")
         assert ref["is_reference"]
 
-    def test_no_reference_returns_none(self):
+    def test_no_reference_returns_none(self, mgr):
         """get_reference returns None when no lap has been marked."""
-        mgr = ReferenceLapManager(":memory:")
         assert mgr.get_reference("spa", "gt3") is None
 
-    def test_get_reference_unknown_track_returns_none(self):
+    def test_get_reference_unknown_track_returns_none(self, mgr):
         """get_reference returns None for an unknown track/car combination."""
-        mgr = ReferenceLapManager(":memory:")
         mgr.record_lap("sess1", 1, "spa", "gt3", 120.5)
         mgr.set_reference("sess1", 1)
         assert mgr.get_reference("monza", "gt3") is None
@@ -46,9 +60,8 @@ class TestReferenceLapManagement:
     # Only one active reference per track+car combo
     # ------------------------------------------------------------------
 
-    def test_only_one_active_reference_per_track_car(self):
+    def test_only_one_active_reference_per_track_car(self, mgr):
         """Setting a second reference for the same track/car replaces the first."""
-        mgr = ReferenceLapManager(":memory:")
         mgr.record_lap("sess1", 1, "spa", "gt3", 120.5)
         mgr.record_lap("sess1", 2, "spa", "gt3", 119.0)
         mgr.set_reference("sess1", 1)
@@ -56,9 +69,8 @@ class TestReferenceLapManagement:
         ref = mgr.get_reference("spa", "gt3")
         assert ref["lap_number"] == 2
 
-    def test_previous_reference_is_cleared(self):
+    def test_previous_reference_is_cleared(self, mgr):
         """After setting a new reference, the previous lap no longer has is_reference."""
-        mgr = ReferenceLapManager(":memory:")
         mgr.record_lap("sess1", 1, "spa", "gt3", 120.5)
         mgr.record_lap("sess1", 2, "spa", "gt3", 119.0)
         mgr.set_reference("sess1", 1)
@@ -68,18 +80,51 @@ class TestReferenceLapManagement:
         ref_count = sum(1 for r in all_laps if r["is_reference"])
         assert ref_count == 1
 
-    def test_references_isolated_by_track(self):
+    def test_get_all_laps_ordered_by_lap_time(self, mgr):
+        """get_all_laps returns one dict per lap, fastest first."""
+        for i, t in enumerate([121.0, 118.0, 125.0], start=1):
+            mgr.record_lap("sess1", i, "spa", "gt3", t)
+        mgr.record_lap("sess1", 4, "monza", "gt3", 100.0)
+        all_laps = mgr.get_all_laps("spa", "gt3")
+        assert [r["lap_number"] for r in all_laps] == [2, 1, 3]
+        assert all_laps[0] == {
+            "session_id": "sess1",
+            "lap_number": 2,
+            "track": "spa",
+            "car": "gt3",
+            "lap_time_s": 118.0,
+            "is_reference": 0,
+        }
+        assert mgr.get_all_laps("monza", "gte") == []
+
+    def test_get_all_laps_preserves_lap_time_precision(self, mgr):
+        """lap_time_s round-trips exactly (full double precision)."""
+        times = [0.1 + 0.2, 1 / 3, 123.456789012345678]
+        for i, t in enumerate(times, start=1):
+            mgr.record_lap("sess1", i, "spa", "gt3", t)
+        assert [r["lap_time_s"] for r in mgr.get_all_laps("spa", "gt3")] == sorted(times)
+
+    def test_lap_time_ordering_uses_index(self, mgr):
+        """Listing laps by time is served by the index, without a sort step."""
+        plan = mgr._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM laps "
+            "WHERE track = ? AND car = ? ORDER BY lap_time_s",
+            ("spa", "gt3"),
+        ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_laps_track_car_time" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_references_isolated_by_track(self, mgr):
         """A reference set for track A does not affect track B."""
-        mgr = ReferenceLapManager(":memory:")
         mgr.record_lap("sess1", 1, "spa", "gt3", 120.0)
         mgr.record_lap("sess1", 2, "monza", "gt3", 100.0)
         mgr.set_reference("sess1", 1)
         assert mgr.get_reference("monza", "gt3") is None
         assert mgr.get_reference("spa", "gt3") is not None
 
-    def test_references_isolated_by_car(self):
+    def test_references_isolated_by_car(self, mgr):
         """A reference set for car A does not affect car B on the same track."""
-        mgr = ReferenceLapManager(":memory:")
         mgr.record_lap("sess1", 1, "spa", "gt3", 120.0)
         mgr.record_lap("sess1", 2, "spa", "gte", 118.0)
         mgr.set_reference("sess1", 1)
@@ -89,28 +134,45 @@ class TestReferenceLapManagement:
     # Auto-select fastest lap
     # ------------------------------------------------------------------
 
-    def test_auto_set_reference_selects_fastest(self):
+    def test_auto_set_reference_selects_fastest(self, mgr):
         """auto_set_reference picks the lap with the minimum lap_time_s."""
-        mgr = ReferenceLapManager(":memory:")
-        for i, t in enumerate([125.0, 118.0, 121.0, 119.5], start=1):
-            mgr.record_lap("sess1", i, "spa", "gt3", t)
+        mgr.record_laps(
+            ("sess1", i, "spa", "gt3", t)
+            for i, t in enumerate([125.0, 118.0, 121.0, 119.5], start=1)
+        )
         mgr.auto_set_reference("spa", "gt3")
         ref = mgr.get_reference("spa", "gt3")
         assert ref is not None
         assert ref["lap_number"] == 2  # 118.0 is fastest
 
-    def test_auto_set_reference_five_laps(self):
+    def test_auto_set_reference_five_laps(self, mgr):
         """auto_set_reference works correctly with five laps of varying times."""
-        mgr = ReferenceLapManager(":memory:")
         times = [130.0, 128.5, 127.1, 126.8, 129.0]
-        for i, t in enumerate(times, start=1):
-            mgr.record_lap("sess1", i, "nordschleife", "gt3", t)
+        mgr.record_laps(
+            ("sess1", i, "nordschleife", "gt3", t) for i, t in enumerate(times, start=1)
+        )
         mgr.auto_set_reference("nordschleife", "gt3")
         ref = mgr.get_reference("nordschleife", "gt3")
         assert ref["lap_number"] == 4  # 126.8 is fastest
 
-    def test_set_reference_unknown_lap_raises(self):
+    def test_record_laps_ignores_existing_laps(self, mgr):
+        """record_laps keeps the first lap_time for a duplicate (session_id, lap_number)."""
+        mgr.record_lap("sess1", 1, "spa", "gt3", 120.0)
+        mgr.record_laps([("sess1", 1, "spa", "gt3", 99.0), ("sess1", 2, "spa", "gt3", 121.0)])
+        assert [r["lap_time_s"] for r in mgr.get_all_laps("spa", "gt3")] == [120.0, 121.0]
+
+    def test_set_reference_unknown_lap_raises(self, mgr):
         """set_reference raises ValueError when the lap has not been recorded."""
-        mgr = ReferenceLapManager(":memory:")
         with pytest.raises(ValueError):
             mgr.set_reference("unknown_session", 99)
+
+    def test_copy_to_memory_is_independent(self, mgr):
+        """A copy sees existing laps, but later writes do not leak between the two."""
+        mgr.record_lap("sess1", 1, "spa", "gt3", 120.0)
+        copy = mgr.copy_to_memory()
+        try:
+            copy.record_lap("sess1", 2, "spa", "gt3", 119.0)
+            assert len(copy.get_all_laps("spa", "gt3")) == 2
+            assert len(mgr.get_all_laps("spa", "gt3")) == 1
+        finally:
+            copy.close()
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import operator
+
+import pytest
+
 from racing_coach.analysis.models import LapFrame
 from racing_coach.analysis.throttle import ThrottleAnalyzer
 from racing_coach.track.models import Corner
+from tests.analysis.helpers import LapColumns, cached_lap
+
+pytestmark = pytest.mark.cpu_analysis
 
 # ---------------------------------------------------------------------------
 # Test-data helpers
@@ -22,12 +29,13 @@ def make_corner() -> Corner:
     )
 
 
+@cached_lap
 def make_exit_lap(
     throttle_at_pct: float = 0.35,
     full_throttle_steer: float = 0.0,
     with_overlap: bool = False,
     total_frames: int = 200,
-) -> list[LapFrame]:
+) -> LapColumns:
     """Lap frames that include the corner exit zone.
 
     Args:
@@ -36,7 +44,7 @@ def make_exit_lap(
             early-throttle test).
         with_overlap:  If True, some frames have both brake and throttle active.
     """
-    frames: list[LapFrame] = []
+    rows: list[tuple[float, ...]] = []
     for i in range(total_frames):
         pct = i / (total_frames - 1)
 
@@ -53,84 +61,73 @@ def make_exit_lap(
             throttle = 0.3
             brake = 0.1  # simultaneous, both above 0.05
 
-        frames.append(LapFrame(
-            lap_dist_pct=pct,
-            lap_time=pct * 60.0,
-            speed=max(10.0, 80.0 - pct * 50.0),
-            throttle=throttle,
-            brake=brake,
-            steering_angle=steer,
-        ))
-    return frames
+        # lap_dist_pct, lap_time, speed, throttle, brake, steering_angle
+        rows.append((pct, pct * 60.0, max(10.0, 80.0 - pct * 50.0), throttle, brake, steer))
+    return tuple(zip(*rows, strict=True))
 
 
 # ---------------------------------------------------------------------------
 # S3-US4: Throttle analysis
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def analyzer() -> ThrottleAnalyzer:
+    return ThrottleAnalyzer(throttle_threshold=0.05)
+
+
 class TestThrottleAnalysis:
     CORNER = make_corner()
 
-    def _analyzer(self) -> ThrottleAnalyzer:
-        return ThrottleAnalyzer(throttle_threshold=0.05)
-
-    def test_throttle_point_detected(self):
-        """First throttle application after apex is detected at the expected position."""
-        lap = make_exit_lap(throttle_at_pct=0.35)
+    @pytest.mark.parametrize(
+        ("lap_kwargs", "attr", "check"),
+        [
+            # First throttle application after apex is detected at the expected position.
+            pytest.param({"throttle_at_pct": 0.35}, "throttle_point_pct",
+                         lambda v: abs(v - 0.35) < 0.02, id="throttle_point_detected"),
+            # Full throttle with large steering angle is flagged.
+            pytest.param({"throttle_at_pct": 0.33, "full_throttle_steer": 0.3},
+                         "too_early_full_throttle", bool, id="too_early_full_throttle_detected"),
+            # Full throttle with small steering angle is not flagged as early.
+            pytest.param({"throttle_at_pct": 0.36, "full_throttle_steer": 0.03},
+                         "too_early_full_throttle", operator.not_,
+                         id="full_throttle_with_small_steer_not_flagged"),
+            # Simultaneous brake > 0.05 and throttle > 0.05 increments overlap_count.
+            pytest.param({"throttle_at_pct": 0.35, "with_overlap": True}, "overlap_count",
+                         lambda v: v > 0, id="overlap_detected"),
+            # No overlap frames in clean driving yields overlap_count = 0.
+            pytest.param({"throttle_at_pct": 0.35, "with_overlap": False}, "overlap_count",
+                         lambda v: v == 0, id="no_overlap_normal_driving"),
+        ],
+    )
+    def test_single_corner_event(self, analyzer, lap_kwargs, attr, check):
+        """One corner vs. the standard 0.35 reference yields one event with *attr* as expected."""
+        lap = make_exit_lap(**lap_kwargs)
         ref = make_exit_lap(throttle_at_pct=0.35)
-        events = self._analyzer().analyze(lap, ref, [self.CORNER])
+        events = analyzer.analyze(lap, ref, [self.CORNER])
         assert len(events) == 1
-        assert abs(events[0].throttle_point_pct - 0.35) < 0.02
+        assert check(getattr(events[0], attr))
 
-    def test_throttle_point_no_throttle_returns_default(self):
+    def test_throttle_point_no_throttle_returns_default(self, analyzer):
         """When no throttle is applied in exit zone, throttle_point_pct = exit_pct."""
         frames = [
             LapFrame(lap_dist_pct=i / 199, lap_time=i / 199 * 60,
                      speed=50.0, throttle=0.0, brake=0.0, steering_angle=0.0)
             for i in range(200)
         ]
-        events = self._analyzer().analyze(frames, frames, [self.CORNER])
+        events = analyzer.analyze(frames, frames, [self.CORNER])
         assert events[0].throttle_point_pct == self.CORNER.exit_pct
 
-    def test_too_early_full_throttle_detected(self):
-        """Full throttle with large steering angle is flagged."""
-        lap = make_exit_lap(throttle_at_pct=0.33, full_throttle_steer=0.3)
-        ref = make_exit_lap(throttle_at_pct=0.35)
-        events = self._analyzer().analyze(lap, ref, [self.CORNER])
-        assert events[0].too_early_full_throttle
-
-    def test_full_throttle_with_small_steer_not_flagged(self):
-        """Full throttle with small steering angle is not flagged as early."""
-        lap = make_exit_lap(throttle_at_pct=0.36, full_throttle_steer=0.03)
-        ref = make_exit_lap(throttle_at_pct=0.35)
-        events = self._analyzer().analyze(lap, ref, [self.CORNER])
-        assert not events[0].too_early_full_throttle
-
-    def test_no_early_throttle_without_full_throttle(self):
+    def test_no_early_throttle_without_full_throttle(self, analyzer):
         """Partial throttle (< 99%) is never flagged as early full throttle."""
         frames = [
             LapFrame(lap_dist_pct=i / 199, lap_time=i / 199 * 60,
                      speed=50.0, throttle=0.7, brake=0.0, steering_angle=0.5)
             for i in range(200)
         ]
-        events = self._analyzer().analyze(frames, frames, [self.CORNER])
+        events = analyzer.analyze(frames, frames, [self.CORNER])
         assert not events[0].too_early_full_throttle
 
-    def test_overlap_detected(self):
-        """Simultaneous brake > 0.05 and throttle > 0.05 increments overlap_count."""
-        lap = make_exit_lap(throttle_at_pct=0.35, with_overlap=True)
-        ref = make_exit_lap(throttle_at_pct=0.35)
-        events = self._analyzer().analyze(lap, ref, [self.CORNER])
-        assert events[0].overlap_count > 0
-
-    def test_no_overlap_normal_driving(self):
-        """No overlap frames in clean driving yields overlap_count = 0."""
-        lap = make_exit_lap(throttle_at_pct=0.35, with_overlap=False)
-        ref = make_exit_lap(throttle_at_pct=0.35)
-        events = self._analyzer().analyze(lap, ref, [self.CORNER])
-        assert events[0].overlap_count == 0
-
-    def test_returns_one_event_per_corner(self):
+    def test_returns_one_event_per_corner(self, analyzer):
         """analyze() returns exactly one ThrottleEvent per Corner."""
         corners = [
             Corner(id=1, entry_pct=0.10, apex_pct=0.15, exit_pct=0.20,
@@ -139,12 +136,12 @@ class TestThrottleAnalysis:
                    direction="R", apex_start=0.62, apex_end=0.67),
         ]
         lap = make_exit_lap()
-        events = self._analyzer().analyze(lap, lap, corners)
+        events = analyzer.analyze(lap, lap, corners)
         assert len(events) == 2
 
-    def test_corner_id_matches(self):
+    def test_corner_id_matches(self, analyzer):
         """ThrottleEvent.corner_id matches the input Corner.id."""
-        events = self._analyzer().analyze(
+        events = analyzer.analyze(
             make_exit_lap(), make_exit_lap(), [self.CORNER]
         )
         assert events[0].corner_id == self.CORNER.id
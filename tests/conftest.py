@@ -0,0 +1,23 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="skip tests marked slow (quick local iteration)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if not config.getoption("--fast"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test skipped by --fast")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -99,7 +99,7 @@ def test_braking_events_attached_by_corner_id():
         [_delta(1), _delta(2)],
         braking_events=[_braking(1)],
     )
-    corner_map = {c.corner_id: c for c in report.corners}
+    corner_map = report.corners_by_id()
     assert corner_map[1].braking is not None
     assert corner_map[1].braking.corner_id == 1
     assert corner_map[2].braking is None
@@ -112,7 +112,7 @@ def test_throttle_events_attached():
         [_delta(1), _delta(2)],
         throttle_events=[_throttle(2)],
     )
-    corner_map = {c.corner_id: c for c in report.corners}
+    corner_map = report.corners_by_id()
     assert corner_map[2].throttle is not None
     assert corner_map[1].throttle is None
 
@@ -124,7 +124,7 @@ def test_apex_results_attached():
         [_delta(1), _delta(2)],
         apex_results=[_apex(2)],
     )
-    corner_map = {c.corner_id: c for c in report.corners}
+    corner_map = report.corners_by_id()
     assert corner_map[2].apex_speed is not None
     assert corner_map[1].apex_speed is None
 
@@ -147,10 +147,9 @@ def test_report_json_serializable():
         apex_results=[_apex(1)],
     )
     d = report.to_dict()
-    raw = json.dumps(d)
-    restored = json.loads(raw)
-    assert restored["session_id"] == "s"
-    assert len(restored["corners"]) == 2
+    json.dumps(d, ensure_ascii=False, separators=(",", ":"))  # raises if not serializable
+    assert d["session_id"] == "s"
+    assert len(d["corners"]) == 2
 
 
 def test_empty_corner_list():
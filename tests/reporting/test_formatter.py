@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import re
 
+import pytest
+
 from racing_coach.analysis.models import ApexSpeedResult, BrakingEvent, ThrottleEvent
 from racing_coach.reporting.aggregator import LapReportAggregator
 from racing_coach.reporting.formatter import MarkdownFormatter
 from racing_coach.reporting.models import LapReport, Suggestion
 
+_NUMBERED_RE = re.compile(r"^\d+\.", re.MULTILINE)
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -54,100 +58,60 @@ def _make_full_report() -> LapReport:
 # ---------------------------------------------------------------------------
 
 
-def test_format_contains_main_header():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    assert "# " in md  # Markdown h1
-
-
-def test_format_contains_track_and_car():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    assert "Spa-Francorchamps" in md
-    assert "Ferrari 488 GT3" in md
+@pytest.fixture(scope="module")
+def fmt() -> MarkdownFormatter:
+    return MarkdownFormatter()
 
 
-def test_format_contains_total_delta():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    assert "1.8" in md or "+1.800" in md
+@pytest.fixture(scope="module")
+def full_md(fmt) -> str:
+    """The full report rendered once and shared by the read-only checks."""
+    return fmt.format(_make_full_report())
 
 
-def test_format_contains_summary_section():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    assert "概要" in md
-    assert "刹车" in md  # part of the summary text
+@pytest.mark.parametrize(
+    "fragments",
+    [
+        pytest.param(["# "], id="main_header"),  # Markdown h1
+        pytest.param(["Spa-Francorchamps", "Ferrari 488 GT3"], id="track_and_car"),
+        pytest.param(["+1.800"], id="total_delta"),
+        pytest.param(["概要", "刹车"], id="summary_section"),  # 刹车 is in the summary text
+        pytest.param(["弯道 1", "弯道 2", "弯道 3"], id="corner_section_for_each_corner"),
+        pytest.param(["抱死"], id="lock_warning"),
+        pytest.param(["过早全油门"], id="early_throttle_warning"),
+        pytest.param(["偏慢"], id="apex_speed_too_slow"),
+        pytest.param(["优先改进"], id="top_improvements"),
+    ],
+)
+def test_format_contains(full_md, fragments):
+    for fragment in fragments:
+        assert fragment in full_md
 
 
-def test_format_skips_summary_section_when_empty():
-    fmt = MarkdownFormatter()
+def test_format_skips_summary_section_when_empty(fmt):
     report = _make_full_report()
     report.summary = ""
     md = fmt.format(report)
     assert "概要" not in md
 
 
-def test_format_contains_corner_section_for_each_corner():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    for i in range(1, 4):
-        assert f"弯道 {i}" in md
-
-
-def test_format_shows_lock_warning():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    assert "抱死" in md
-
-
-def test_format_shows_early_throttle_warning():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    assert "过早全油门" in md or "早油门" in md
-
-
-def test_format_shows_apex_speed_too_slow():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    assert "偏慢" in md or "弯心速度" in md
-
-
-def test_format_contains_top_improvements():
-    fmt = MarkdownFormatter()
-    report = _make_full_report()
-    md = fmt.format(report)
-    assert "优先改进" in md or "Top 3" in md or "改进" in md
-
-
-def test_format_top_improvements_at_most_3():
-    fmt = MarkdownFormatter()
+def test_format_top_improvements_at_most_3(fmt):
     report = _make_full_report()
     report.top_improvements = [Suggestion(i, "high", f"fix {i}") for i in range(1, 6)]
     md = fmt.format(report)
     # Only the first 3 should appear as numbered items
-    numbered = re.findall(r"^\d+\.", md, re.MULTILINE)
+    numbered = _NUMBERED_RE.findall(md)
     assert len(numbered) <= 3
 
 
-def test_format_no_top_improvements_skips_section():
-    fmt = MarkdownFormatter()
+def test_format_no_top_improvements_skips_section(fmt):
     report = _make_full_report()
     report.top_improvements = []
     md = fmt.format(report)
     assert "优先改进" not in md
 
 
-def test_write_creates_file(tmp_path):
-    fmt = MarkdownFormatter()
+def test_write_creates_file(fmt, tmp_path):
     report = _make_full_report()
     out = tmp_path / "report.md"
     fmt.write(report, str(out))
@@ -6,6 +6,8 @@ import json
 import logging
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from racing_coach.analysis.models import ApexSpeedResult, BrakingEvent, ThrottleEvent
 from racing_coach.reporting.aggregator import LapReportAggregator
 from racing_coach.reporting.llm_client import (
@@ -79,6 +81,11 @@ def test_parse_llm_response_invalid_json_returns_empty():
     assert suggestions == []
 
 
+@pytest.mark.parametrize("raw", ["", "   ", "Sorry, I cannot help.", "[1, 2]", "42"])
+def test_parse_llm_response_non_object_returns_empty(raw):
+    assert parse_llm_response(raw) == ("", [])
+
+
 def test_parse_llm_response_missing_fields_returns_empty():
     summary, suggestions = parse_llm_response("{}")
     assert summary == ""
@@ -219,7 +226,7 @@ def test_analyze_applies_suggestions_from_llm():
         result = client.analyze(report)
 
     assert result.summary == "Good braking, improve corner 1 exit."
-    corner_map = {c.corner_id: c for c in result.corners}
+    corner_map = result.corners_by_id()
     assert len(corner_map[1].suggestions) == 1
     assert corner_map[1].suggestions[0].severity == "high"
 
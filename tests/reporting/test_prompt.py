@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from racing_coach.analysis.models import ApexSpeedResult, BrakingEvent, ThrottleEvent
 from racing_coach.reporting.aggregator import LapReportAggregator
 from racing_coach.reporting.models import LapReport
@@ -96,6 +98,12 @@ def test_system_prompt_contains_json_format_instruction():
     assert "JSON" in system
 
 
+def test_system_prompt_is_read_only_property():
+    builder = PromptBuilder()
+    with pytest.raises(AttributeError):
+        builder.system_prompt = "override"
+
+
 def test_build_contains_json_output_format():
     builder = PromptBuilder()
     report = _make_report()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -36,32 +35,41 @@ _FRAME_DATA = [
 ]
 
 
-def _make_mock_sdk(frames: list[dict] | None = None) -> MagicMock:
-    """Return a mock SDK that produces the given frames when iterated."""
-    frames = frames or _FRAME_DATA
-    sdk = MagicMock()
-    sdk.__enter__ = MagicMock(return_value=sdk)
-    sdk.__exit__ = MagicMock(return_value=False)
+class _FakeSDK:
+    """Minimal stand-in for ``irsdk.IRSDK`` that replays *frames* from memory.
 
-    call_count = {"n": 0}
+    A plain class rather than a MagicMock: the reader calls ``sdk[key]`` once
+    per channel per frame, and mock call interception would dominate the run.
+    """
 
-    def fake_getitem(key):
-        idx = call_count["n"]
-        return frames[idx].get(key)
+    def __init__(
+        self,
+        frames: list[dict] | None = None,
+        startup_result: bool = True,
+        startup_error: Exception | None = None,
+    ) -> None:
+        self._frames = frames or _FRAME_DATA
+        self._idx = 0
+        self._startup_result = startup_result
+        self._startup_error = startup_error
 
-    def fake_parse_to_next():
-        idx = call_count["n"]
-        if idx < len(frames) - 1:
-            call_count["n"] += 1
+    def startup(self, test_file: str | None = None) -> bool:
+        if self._startup_error is not None:
+            raise self._startup_error
+        return self._startup_result
+
+    def shutdown(self) -> None:
+        pass
+
+    def __getitem__(self, key: str):
+        return self._frames[self._idx].get(key)
+
+    def parse_to_next(self) -> bool:
+        if self._idx < len(self._frames) - 1:
+            self._idx += 1
             return True
         return False
 
-    sdk.__getitem__ = MagicMock(side_effect=fake_getitem)
-    sdk.parse_to_next = MagicMock(side_effect=fake_parse_to_next)
-    sdk.startup = MagicMock(return_value=True)
-    sdk.shutdown = MagicMock()
-    return sdk
-
 
 # ---------------------------------------------------------------------------
 # S1-US4 AC1: output structure matches S1-US2 (all 11 fields, correct types)
@@ -71,8 +79,8 @@ def test_read_yields_telemetry_frames(tmp_path):
     fake_path = str(tmp_path / "fake.ibt")
     Path(fake_path).touch()
 
-    mock_sdk = _make_mock_sdk()
-    reader = IBTReader(sdk_factory=lambda: mock_sdk)
+    sdk = _FakeSDK()
+    reader = IBTReader(sdk_factory=lambda: sdk)
     frames = list(reader.read(fake_path))
 
     assert len(frames) == len(_FRAME_DATA)
@@ -84,8 +92,8 @@ def test_read_frame_has_all_required_fields(tmp_path):
     fake_path = str(tmp_path / "fake.ibt")
     Path(fake_path).touch()
 
-    mock_sdk = _make_mock_sdk()
-    reader = IBTReader(sdk_factory=lambda: mock_sdk)
+    sdk = _FakeSDK()
+    reader = IBTReader(sdk_factory=lambda: sdk)
     frame = next(iter(reader.read(fake_path)))
 
     required = (
@@ -101,8 +109,8 @@ def test_read_frame_values_match_raw_data(tmp_path):
     fake_path = str(tmp_path / "fake.ibt")
     Path(fake_path).touch()
 
-    mock_sdk = _make_mock_sdk()
-    reader = IBTReader(sdk_factory=lambda: mock_sdk)
+    sdk = _FakeSDK()
+    reader = IBTReader(sdk_factory=lambda: sdk)
     frames = list(reader.read(fake_path))
 
     first = _FRAME_DATA[0]
@@ -117,8 +125,8 @@ def test_read_all_frames_returned(tmp_path):
     fake_path = str(tmp_path / "fake.ibt")
     Path(fake_path).touch()
 
-    mock_sdk = _make_mock_sdk()
-    reader = IBTReader(sdk_factory=lambda: mock_sdk)
+    sdk = _FakeSDK()
+    reader = IBTReader(sdk_factory=lambda: sdk)
     frames = list(reader.read(fake_path))
 
     assert len(frames) == 3
@@ -141,8 +149,7 @@ def test_read_empty_file_raises_ibt_read_error(tmp_path):
     empty_file = tmp_path / "empty.ibt"
     empty_file.write_bytes(b"")
 
-    failing_sdk = MagicMock()
-    failing_sdk.startup = MagicMock(return_value=False)
+    failing_sdk = _FakeSDK(startup_result=False)
 
     reader = IBTReader(sdk_factory=lambda: failing_sdk)
     with pytest.raises(IBTReadError, match=r"[Cc]ould not open|[Ff]ailed|not open"):
@@ -153,8 +160,7 @@ def test_read_non_ibt_file_raises_ibt_read_error(tmp_path):
     bad_file = tmp_path / "notanIBT.txt"
     bad_file.write_text("this is not an ibt file")
 
-    failing_sdk = MagicMock()
-    failing_sdk.startup = MagicMock(return_value=False)
+    failing_sdk = _FakeSDK(startup_result=False)
 
     reader = IBTReader(sdk_factory=lambda: failing_sdk)
     with pytest.raises(IBTReadError):
@@ -165,8 +171,7 @@ def test_read_sdk_exception_wrapped_as_ibt_read_error(tmp_path):
     fake_path = str(tmp_path / "fake.ibt")
     Path(fake_path).touch()
 
-    broken_sdk = MagicMock()
-    broken_sdk.startup = MagicMock(side_effect=OSError("mmap failed"))
+    broken_sdk = _FakeSDK(startup_error=OSError("mmap failed"))
 
     reader = IBTReader(sdk_factory=lambda: broken_sdk)
     with pytest.raises(IBTReadError):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from racing_coach.telemetry.models import TelemetryFrame
@@ -13,28 +15,29 @@ from racing_coach.telemetry.parser import TelemetryParser
 
 G = 9.80665  # m/s² per g
 
+_BASE_RAW = {
+    "Speed": 50.0,
+    "Throttle": 0.8,
+    "Brake": 0.0,
+    "SteeringWheelAngle": 0.1,
+    "Gear": 4,
+    "RPM": 6500.0,
+    "LongAccel": 5.0,   # m/s² → 0.51 g
+    "LatAccel": -9.81,  # m/s² → -1.0 g
+    "LapDistPct": 0.45,
+    "Lap": 3,
+    "LapCurrentLapTime": 42.5,
+}
+
 
 def make_raw(**overrides) -> dict:
-    """Return a minimal valid raw iRacing data dict."""
-    base = {
-        "Speed": 50.0,
-        "Throttle": 0.8,
-        "Brake": 0.0,
-        "SteeringWheelAngle": 0.1,
-        "Gear": 4,
-        "RPM": 6500.0,
-        "LongAccel": 5.0,   # m/s² → 0.51 g
-        "LatAccel": -9.81,  # m/s² → -1.0 g
-        "LapDistPct": 0.45,
-        "Lap": 3,
-        "LapCurrentLapTime": 42.5,
-    }
-    base.update(overrides)
-    return base
-
-
-@pytest.fixture
+    """Return a minimal valid raw iRacing data dict (a fresh copy of ``_BASE_RAW``)."""
+    return _BASE_RAW | overrides
+
+
+@pytest.fixture(scope="module")
 def parser() -> TelemetryParser:
+    """TelemetryParser holds no state, so one instance serves the whole module."""
     return TelemetryParser()
 
 
@@ -64,8 +67,8 @@ def test_parse_returns_telemetry_frame(parser):
 
 def test_parse_contains_all_required_fields(parser):
     frame = parser.parse(make_raw())
-    for field in REQUIRED_FIELDS:
-        assert hasattr(frame, field), f"Missing field: {field}"
+    names = {f.name for f in dataclasses.fields(frame)}
+    assert set(REQUIRED_FIELDS) <= names, f"Missing fields: {set(REQUIRED_FIELDS) - names}"
 
 
 def test_parse_field_values_correct(parser):
@@ -104,9 +107,9 @@ def test_parse_field_values_correct(parser):
 def test_parse_clamps_out_of_range(parser, field, raw_key, bad_value, expected):
     raw = make_raw(**{raw_key: bad_value})
     frame = parser.parse(raw)
-    assert getattr(frame, field) == pytest.approx(expected), (
-        f"{field}: expected {expected}, got {getattr(frame, field)}"
-    )
+    actual = getattr(frame, field)
+    # Clamping returns the bound itself, so the comparison is exact.
+    assert actual == expected, f"{field}: expected {expected}, got {actual}"
 
 
 @pytest.mark.parametrize("raw_key", [
@@ -129,6 +132,12 @@ def test_parse_inf_input_is_clamped(parser, raw_key):
     assert frame.is_valid(), f"Frame invalid after Inf in {raw_key}"
 
 
+def test_parse_many_matches_parse(parser):
+    raws = [make_raw(), make_raw(Throttle=1.5), make_raw(Speed=float("nan"), Gear=12)]
+    assert parser.parse_many(raws) == [parser.parse(r) for r in raws]
+    assert parser.parse_many(iter(raws[:1])) == [parser.parse(raws[0])]
+
+
 # ---------------------------------------------------------------------------
 # S1-US2 AC3: performance — parse < 1ms (p99 over 1000 rounds)
 # ---------------------------------------------------------------------------
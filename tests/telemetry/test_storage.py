@@ -2,31 +2,35 @@
 
 from __future__ import annotations
 
+import dataclasses
 import os
+import sqlite3
+import struct
 import time
+import zlib
 
 import pytest
 
 from racing_coach.telemetry.models import TelemetryFrame
 from racing_coach.telemetry.storage import TelemetryStorage
 
+_PROTO_FRAME = TelemetryFrame(
+    speed=50.0,
+    throttle=0.8,
+    brake=0.0,
+    steering_angle=0.1,
+    gear=4,
+    rpm=6500.0,
+    g_force_lon=0.5,
+    g_force_lat=-1.0,
+    lap_dist_pct=0.45,
+    lap_number=3,
+    lap_time=42.5,
+)
+
 
 def make_frame(**overrides) -> TelemetryFrame:
-    defaults = dict(
-        speed=50.0,
-        throttle=0.8,
-        brake=0.0,
-        steering_angle=0.1,
-        gear=4,
-        rpm=6500.0,
-        g_force_lon=0.5,
-        g_force_lat=-1.0,
-        lap_dist_pct=0.45,
-        lap_number=3,
-        lap_time=42.5,
-    )
-    defaults.update(overrides)
-    return TelemetryFrame(**defaults)
+    return dataclasses.replace(_PROTO_FRAME, **overrides) if overrides else _PROTO_FRAME
 
 
 @pytest.fixture
@@ -81,14 +85,203 @@ def test_get_lap_returns_correct_values(storage):
     assert rows[0]["session_id"] == "sess"
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (-0.3, 0.0),
+        (1.7, 1.0),
+        (0.12345, 0.1235),
+        (float("nan"), 0.0),
+        (float("inf"), 1.0),
+        (float("-inf"), 0.0),
+    ],
+)
+def test_save_frame_clips_scaled_fields(storage, value, expected):
+    frame = make_frame(throttle=value, brake=value, lap_dist_pct=value)
+    storage.save_frame("sess", 1, 0.0, frame)
+    row = storage.get_lap("sess", 1)[0]
+    assert row["throttle"] == pytest.approx(expected)
+    assert row["brake"] == pytest.approx(expected)
+    assert row["lap_dist_pct"] == pytest.approx(expected)
+
+
 def test_get_lap_returns_empty_for_missing(storage):
     assert storage.get_lap("no_such_session", 99) == []
 
 
+def test_get_lap_spans_chunks_and_reopen(db_path):
+    storage = TelemetryStorage(db_path)
+    for i in range(200):
+        storage.save_frame("sess", 1, float(i), make_frame(lap_dist_pct=i / 1000))
+    storage.close()
+
+    storage = TelemetryStorage(db_path)
+    for i in range(200, 210):
+        storage.save_frame("sess", 1, float(i), make_frame(lap_dist_pct=i / 1000))
+    rows = storage.get_lap("sess", 1)
+    storage.close()
+
+    assert len(rows) == 210
+    assert [r["timestamp"] for r in rows] == [float(i) for i in range(210)]
+    assert rows[-1]["lap_dist_pct"] == pytest.approx(0.209)
+
+
+def test_lap_change_commits_previous_lap(db_path):
+    storage = TelemetryStorage(db_path)
+    for i in range(10):
+        storage.save_frame("sess", 1, float(i), make_frame(lap_number=1))
+    storage.save_frame("sess", 2, 10.0, make_frame(lap_number=2))
+
+    other = TelemetryStorage(db_path)  # separate connection: sees committed data only
+    assert len(other.get_lap("sess", 1)) == 10
+    other.close()
+    storage.close()
+
+
+def test_close_twice_is_noop(db_path):
+    storage = TelemetryStorage(db_path)
+    storage.save_frame("sess", 1, 0.0, make_frame())
+    storage.close()
+    storage.close()  # must not raise
+
+    reopened = TelemetryStorage(db_path)
+    assert len(reopened.get_lap("sess", 1)) == 1
+    reopened.close()
+
+
+def test_close_closes_connection_when_flush_fails(db_path, monkeypatch):
+    storage = TelemetryStorage(db_path)
+    storage.save_frame("sess", 1, 0.0, make_frame())
+
+    def fail() -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(storage, "_flush", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        storage.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        storage._conn.execute("SELECT 1")
+    storage.close()  # already closed: must not raise
+
+
+def test_get_lap_columns_matches_get_lap(storage):
+    for i in range(5):
+        storage.save_frame("sess", 2, float(i), make_frame(lap_dist_pct=i / 10, brake=0.25))
+    columns = storage.get_lap_columns("sess", 2)
+    rows = storage.get_lap("sess", 2)
+
+    assert len(columns["speed"]) == 5
+    assert columns["lap_dist_pct"] == pytest.approx([i / 10 for i in range(5)])
+    assert columns["brake"] == pytest.approx([0.25] * 5)
+    for name, values in columns.items():
+        assert values == [r[name] for r in rows]
+
+
+def test_get_lap_reads_legacy_row_major_chunks(storage):
+    """Chunks written in the older row-major zlib codec are still decoded."""
+    from racing_coach.telemetry import storage as storage_mod
+
+    storage.save_frame("sess", 1, 0.0, make_frame())  # creates the session row
+    records = b"".join(
+        storage_mod._FRAME.pack(ts, 40.0 + ts, 5000, 0, 0.1, 4, 6500.0, 0.5, -1.0, 0, ts)
+        for ts in (1.0, 2.0, 3.0)
+    )
+    storage._flush()
+    storage._conn.execute(
+        storage_mod._INSERT_CHUNK,
+        (1, 1, 99, 3, storage_mod._CODEC_ZLIB, zlib.compress(records)),
+    )
+    storage._conn.commit()
+
+    columns = storage.get_lap_columns("sess", 1)
+    assert columns["timestamp"] == [0.0, 1.0, 2.0, 3.0]
+    assert columns["speed"][1:] == [41.0, 42.0, 43.0]
+    assert columns["throttle"][1:] == [0.5] * 3
+
+
+def test_get_lap_rejects_row_major_chunk_with_wrong_frame_count(storage):
+    from racing_coach.telemetry import storage as storage_mod
+
+    storage.save_frame("sess", 1, 0.0, make_frame())
+    record = storage_mod._FRAME.pack(1.0, 40.0, 5000, 0, 0.1, 4, 6500.0, 0.5, -1.0, 0, 1.0)
+    storage._flush()
+    storage._conn.execute(
+        storage_mod._INSERT_CHUNK, (1, 1, 99, 2, storage_mod._CODEC_RAW, record)
+    )
+    storage._conn.commit()
+
+    with pytest.raises(struct.error):
+        storage.get_lap_columns("sess", 1)
+
+
+def test_get_lap_reads_pre_chunk_telemetry_frames_table(db_path):
+    """A database in the original one-row-per-frame layout is still readable."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE sessions (idx INTEGER PRIMARY KEY, session_id TEXT NOT NULL UNIQUE);
+        CREATE TABLE telemetry_frames (
+            session_idx INTEGER NOT NULL, lap_number INTEGER NOT NULL,
+            timestamp REAL NOT NULL, speed REAL, throttle INTEGER, brake INTEGER,
+            steering_angle REAL, gear INTEGER, rpm REAL, g_force_lon REAL,
+            g_force_lat REAL, lap_dist_pct INTEGER, lap_time REAL
+        );
+        INSERT INTO sessions (idx, session_id) VALUES (1, 'old');
+    """)
+    conn.executemany(
+        "INSERT INTO telemetry_frames "
+        "VALUES (1, 2, ?, ?, 8000, 0, 0.1, 4, 6500.0, 0.5, -1.0, ?, ?)",
+        [(float(ts), 40.0 + ts, ts * 100, 10.0 + ts) for ts in (1, 0, 2)],
+    )
+    conn.commit()
+    conn.close()
+
+    storage = TelemetryStorage(db_path)
+    rows = storage.get_lap("old", 2)
+    assert [r["timestamp"] for r in rows] == [0.0, 1.0, 2.0]
+    assert [r["speed"] for r in rows] == [40.0, 41.0, 42.0]
+    assert rows[0]["throttle"] == pytest.approx(0.8)
+    assert [r["lap_dist_pct"] for r in rows] == pytest.approx([0.0, 0.01, 0.02])
+
+    # Frames appended after the upgrade are merged with the old ones.
+    storage.save_frame("old", 2, 3.0, make_frame(lap_number=2))
+    assert [r["timestamp"] for r in storage.get_lap("old", 2)] == [0.0, 1.0, 2.0, 3.0]
+    assert storage.get_laps_columns("old", [2])[2]["timestamp"] == [0.0, 1.0, 2.0, 3.0]
+    storage.close()
+
+
+def test_get_lap_orders_out_of_order_frames_by_timestamp(storage):
+    for ts in (5.0, 1.0, 3.0):
+        storage.save_frame("sess", 1, ts, make_frame(lap_dist_pct=ts / 10))
+    columns = storage.get_lap_columns("sess", 1)
+    assert columns["timestamp"] == [1.0, 3.0, 5.0]
+    assert columns["lap_dist_pct"] == pytest.approx([0.1, 0.3, 0.5])
+
+
+def test_get_lap_columns_empty_for_missing(storage):
+    columns = storage.get_lap_columns("no_such_session", 99)
+    assert columns["speed"] == []
+    assert "lap_dist_pct" in columns
+
+
+def test_get_laps_columns_matches_per_lap_reads(storage):
+    for lap in (1, 2, 3):
+        for i in range(150):  # > one chunk per lap
+            storage.save_frame("sess", lap, lap * 1000.0 + i, make_frame(speed=lap + i / 1000))
+    storage.save_frame("other", 2, 0.0, make_frame())
+
+    laps = storage.get_laps_columns("sess", [3, 1, 7])
+    assert list(laps) == [3, 1, 7]
+    assert laps[3] == storage.get_lap_columns("sess", 3)
+    assert laps[1] == storage.get_lap_columns("sess", 1)
+    assert laps[7]["speed"] == []
+    assert storage.get_laps_columns("sess", []) == {}
+
+
 # ---------------------------------------------------------------------------
 # S1-US3 AC3: file size < 50MB for 100 laps x 60s x 60Hz
 # ---------------------------------------------------------------------------
 
+@pytest.mark.slow
 def test_file_size_under_50mb_for_100_laps(tmp_path):
     db_file = str(tmp_path / "big_test.db")
     storage = TelemetryStorage(db_file)